@@ -1,13 +1,22 @@
+import logging
+import math
+
 import pandas as pd
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
 def clean_data(data):
-    if isinstance(data, dict):
-        return {k: clean_data(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [clean_data(i) for i in data]
-    elif isinstance(data, float) and (np.isnan(data) or np.isinf(data)):
-        return None
+    # Exact type checks cover almost every value in the result dicts; the
+    # isinstance fallbacks catch subclasses such as numpy.float64.
+    data_type = type(data)
+    if data_type is float: return data if math.isfinite(data) else None
+    if data_type is dict: return {k: clean_data(v) for k, v in data.items()}
+    if data_type is list: return [clean_data(i) for i in data]
+    if data_type is int or data_type is str or data is None: return data
+    if isinstance(data, dict): return {k: clean_data(v) for k, v in data.items()}
+    if isinstance(data, list): return [clean_data(i) for i in data]
+    if isinstance(data, float) and not math.isfinite(data): return None
     return data
 
 # --- Configuration ---
@@ -18,109 +27,132 @@ MIN_ACCEPTABLE_RETURN = 0.15
 DEFAULT_TAX_RATE = 0.21
 GROWTH_RATE_CAP = 0.15
 FUTURE_PE_CAP = 30.0
+NET_MARGIN_TREND_TOLERANCE = 1e-4  # Margin change per year treated as flat
 
 # --- Helper Functions ---
-def get_safe_value(data_structure, key, is_column_data=False):
+def dict_get(data, key):
+    # Fast path for the yfinance info dict and pre-extracted statement columns.
+    return data.get(key) if data else None
+
+def row_get(statement, key, idx_set=None):
+    # Row of a statement DataFrame (as a Series), or a scalar from a Series; idx_set is an optional
+    # precomputed frozenset of statement.index for repeated lookups.
+    if statement is None or (idx_set is not None and key not in idx_set): return None
+    # Index.get_loc hits the index's cached hash table; positional iloc skips .loc's label dispatch.
+    try: return statement.iloc[statement.index.get_loc(key)]
+    except KeyError: return None
+
+def get_safe_value(data_structure, key, is_column_data=False, idx_set=None):
+    # Generic lookup kept for compatibility; prefer dict_get/row_get when the input type is known.
+    # Dicts (yfinance info, pre-extracted statement columns) are the common case: answer them first.
+    # Exact type checks are a pointer compare; inputs here are plain dict/Series/DataFrame, not subclasses.
+    data_type = type(data_structure)
+    if data_type is dict: return data_structure.get(key)
     if data_structure is None: return None
-    if isinstance(data_structure, dict): return data_structure.get(key)
+    if idx_set is not None and key not in idx_set: return None
     if is_column_data:
-        if not isinstance(data_structure, pd.Series): return None
+        if data_type is not pd.Series: return None
         return data_structure.get(key)
-    if isinstance(data_structure, pd.DataFrame):
-        if key in data_structure.index: return data_structure.loc[key]
-        return None
-    if isinstance(data_structure, pd.Series): return data_structure.get(key)
+    if data_type is pd.DataFrame: return row_get(data_structure, key)
+    if data_type is pd.Series: return data_structure.get(key)
     return None
 
-def calculate_cagr(series, years_to_consider=YEARS_OF_DATA):
-    if not isinstance(series, pd.Series) or series.empty: return None
-    series_numeric = pd.to_numeric(series, errors='coerce').dropna().sort_index()
-    if len(series_numeric) < 2: return None
-    series_recent = series_numeric.tail(years_to_consider + 1)
-    if len(series_recent) < 2: series_recent = series_numeric
-    if len(series_recent) < 2: return None
-    start_value, end_value = series_recent.iloc[0], series_recent.iloc[-1]
-    num_periods = len(series_recent) - 1
-    if start_value == 0 or start_value is None or end_value is None or num_periods == 0: return None
+def _as_float_array(series):
+    # yfinance statements are already float64; only object-dtype data (e.g. FMP) needs coercion.
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'fiu': return series.to_numpy(dtype=np.float64, copy=False)
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+def _cagr_kernel(values, years_to_consider):
+    # values: float64 array in chronological order, may contain NaN.
+    values = values[~np.isnan(values)]
+    if values.size < 2: return None
+    if years_to_consider >= 1: values = values[-(years_to_consider + 1):]
+    start_value, end_value = float(values[0]), float(values[-1])
+    num_periods = values.size - 1
+    if start_value == 0: return None
     if (end_value > 0 and start_value < 0) or (end_value < 0 and start_value > 0): return None
     if start_value < 0 and end_value >=0: return None
     return ((end_value / start_value) ** (1 / num_periods)) - 1
 
+def calculate_cagr_array(values, years, years_to_consider=YEARS_OF_DATA):
+    # values/years: parallel arrays in any order; NaN values are skipped.
+    if values.size == 0: return None
+    return _cagr_kernel(values[np.argsort(years, kind='stable')], years_to_consider)
+
+def calculate_cagr(series, years_to_consider=YEARS_OF_DATA):
+    if not isinstance(series, pd.Series) or series.empty: return None
+    # Work on the raw values: the series holds at most a few dozen points, so
+    # pandas' per-call overhead (dropna/sort_index/tail/iloc) dominates.
+    return calculate_cagr_array(_as_float_array(series), series.index.to_numpy(), years_to_consider)
+
 # --- Phil Town Strategy Functions ---
+ROIC_FINANCIALS_ROWS = ['EBIT', 'Net Income', 'Interest Expense', 'Tax Provision', 'Operating Income', 'Pretax Income']
+ROIC_BALANCE_SHEET_ROWS = ['Stockholders Equity', 'Long Term Debt', 'Total Debt', 'Current Debt']
+
 def calculate_roic_phil_town(financials, balance_sheet, years_to_consider=YEARS_OF_DATA):
     
-    roics = []
     if financials.empty or balance_sheet.empty: return clean_data((None, []))
-    common_years = financials.columns.intersection(balance_sheet.columns)
-    sorted_common_years = sorted(common_years, reverse=True)[:years_to_consider]
-    for year_col in sorted_common_years:
-        year_financials, year_balance_sheet = financials[year_col], balance_sheet[year_col]
-        ebit = get_safe_value(year_financials, 'EBIT', is_column_data=True)
-        if ebit is None:
-            net_income = get_safe_value(year_financials, 'Net Income', is_column_data=True)
-            interest_expense = get_safe_value(year_financials, 'Interest Expense', is_column_data=True)
-            tax_provision = get_safe_value(year_financials, 'Tax Provision', is_column_data=True)
-            if all(v is not None for v in [net_income, interest_expense, tax_provision]):
-                ebit = net_income + interest_expense + tax_provision
-            else: ebit = get_safe_value(year_financials, 'Operating Income', is_column_data=True)
-        if ebit is None: continue
-        income_before_tax = get_safe_value(year_financials, 'Pretax Income', is_column_data=True)
-        tax_provision = get_safe_value(year_financials, 'Tax Provision', is_column_data=True)
-        tax_rate = DEFAULT_TAX_RATE
-        if income_before_tax and tax_provision and income_before_tax != 0:
-            current_tax_rate = tax_provision / income_before_tax
-            if 0 <= current_tax_rate <= 0.60: tax_rate = current_tax_rate
-        nopat = ebit * (1 - tax_rate)
-        total_equity = get_safe_value(year_balance_sheet, 'Stockholders Equity', is_column_data=True)
-        long_term_debt = get_safe_value(year_balance_sheet, 'Long Term Debt', is_column_data=True)
-        if long_term_debt is None:
-            total_debt = get_safe_value(year_balance_sheet, 'Total Debt', is_column_data=True)
-            current_debt = get_safe_value(year_balance_sheet, 'Current Debt', is_column_data=True)
-            if total_debt is not None and current_debt is not None: long_term_debt = total_debt - current_debt
-            elif total_debt is not None: long_term_debt = total_debt
-            else: long_term_debt = 0
-        if total_equity is None: continue
-        invested_capital = total_equity + (long_term_debt if long_term_debt is not None else 0)
-        if invested_capital and invested_capital != 0: roics.append(nopat / invested_capital)
-        else: roics.append(None)
-    valid_roics = [r for r in roics if r is not None and isinstance(r, (int, float)) and not np.isnan(r) and not np.isinf(r)]
+    sorted_common_years = sorted(set(financials.columns) & set(balance_sheet.columns), reverse=True)[:years_to_consider]
+    fin_idx, bs_idx = frozenset(financials.index), frozenset(balance_sheet.index)
+    # One float array per line item, one slot per year (newest first); absent rows come back as NaN.
+    ebit, net_income, interest_expense, tax_provision, operating_income, income_before_tax = financials.reindex(
+        index=ROIC_FINANCIALS_ROWS, columns=sorted_common_years).to_numpy(dtype=np.float64, na_value=np.nan)
+    total_equity, long_term_debt, total_debt, current_debt = balance_sheet.reindex(
+        index=ROIC_BALANCE_SHEET_ROWS, columns=sorted_common_years).to_numpy(dtype=np.float64, na_value=np.nan)
+    if 'EBIT' not in fin_idx:
+        if {'Net Income', 'Interest Expense', 'Tax Provision'} <= fin_idx: ebit = net_income + interest_expense + tax_provision
+        elif 'Operating Income' in fin_idx: ebit = operating_income
+        else: return clean_data(None), []
+    if 'Stockholders Equity' not in bs_idx: return clean_data(None), []
+    with np.errstate(divide='ignore', invalid='ignore'):
+        current_tax_rate = tax_provision / income_before_tax
+    # Zero/missing inputs and implausible effective rates fall back to the default rate.
+    tax_rate = np.where((income_before_tax != 0) & (tax_provision != 0) & (current_tax_rate >= 0) & (current_tax_rate <= 0.60),
+                        current_tax_rate, DEFAULT_TAX_RATE)
+    nopat = ebit * (1 - tax_rate)
+    if 'Long Term Debt' not in bs_idx:
+        if 'Total Debt' in bs_idx and 'Current Debt' in bs_idx: long_term_debt = total_debt - current_debt
+        elif 'Total Debt' in bs_idx: long_term_debt = total_debt
+        else: long_term_debt = np.zeros_like(total_equity)
+    invested_capital = total_equity + long_term_debt
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roics = np.where(invested_capital != 0, nopat / invested_capital, np.nan)
+    valid_roics = roics[np.isfinite(roics)]
     
-    return clean_data((sum(valid_roics) / len(valid_roics)) if valid_roics else None), clean_data(valid_roics)
+    return clean_data(float(valid_roics.mean()) if valid_roics.size else None), clean_data(valid_roics.tolist())
 
 def get_growth_rates_phil_town(stock_data, years_to_consider=YEARS_OF_DATA):
     
     financials, balance_sheet, cash_flow = stock_data["financials"], stock_data["balance_sheet"], stock_data["cash_flow"]
     
+    fin_idx, bs_idx, cf_idx = frozenset(financials.index), frozenset(balance_sheet.index), frozenset(cash_flow.index)
     growth_rates = {}
     eps_series = None
     if not financials.empty:
-        if 'Diluted EPS' in financials.index: eps_series = get_safe_value(financials, 'Diluted EPS', is_column_data=False)
-        elif 'Basic EPS' in financials.index: eps_series = get_safe_value(financials, 'Basic EPS', is_column_data=False)
+        eps_key = 'Diluted EPS' if 'Diluted EPS' in fin_idx else ('Basic EPS' if 'Basic EPS' in fin_idx else None)
+        if eps_key: eps_series = row_get(financials, eps_key, idx_set=fin_idx)
     growth_rates['eps_cagr'] = calculate_cagr(eps_series, years_to_consider)
-    bvps_series = None
+    growth_rates['bvps_cagr'] = None
     if not balance_sheet.empty and not financials.empty:
-        equity = get_safe_value(balance_sheet, 'Stockholders Equity', is_column_data=False)
-        shares = None
-        if 'Diluted Average Shares' in financials.index: shares = get_safe_value(financials, 'Diluted Average Shares', is_column_data=False)
-        elif 'Basic Average Shares' in financials.index: shares = get_safe_value(financials, 'Basic Average Shares', is_column_data=False)
+        equity = row_get(balance_sheet, 'Stockholders Equity', idx_set=bs_idx)
+        shares_key = 'Diluted Average Shares' if 'Diluted Average Shares' in fin_idx else ('Basic Average Shares' if 'Basic Average Shares' in fin_idx else None)
+        shares = row_get(financials, shares_key, idx_set=fin_idx) if shares_key else None
         if isinstance(equity, pd.Series) and isinstance(shares, pd.Series):
             aligned_equity, aligned_shares = equity.align(shares, join='inner')
-            if not aligned_equity.empty and not aligned_shares.empty:
-                bvps_values = {yr: aligned_equity[yr] / aligned_shares[yr] for yr in aligned_equity.index if pd.notna(aligned_equity[yr]) and pd.notna(aligned_shares[yr]) and aligned_shares[yr] != 0}
-                if bvps_values: bvps_series = pd.Series(bvps_values)
-    growth_rates['bvps_cagr'] = calculate_cagr(bvps_series, years_to_consider)
-    revenue_series = get_safe_value(financials, 'Total Revenue', is_column_data=False)
+            equity_values, shares_values = _as_float_array(aligned_equity), _as_float_array(aligned_shares)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                bvps_values = np.where(shares_values != 0, equity_values / shares_values, np.nan)
+            growth_rates['bvps_cagr'] = calculate_cagr_array(bvps_values, aligned_equity.index.to_numpy(), years_to_consider)
+    revenue_series = row_get(financials, 'Total Revenue', idx_set=fin_idx)
     growth_rates['sales_cagr'] = calculate_cagr(revenue_series, years_to_consider)
-    fcf_series = None
+    growth_rates['fcf_cagr'] = None
     if not cash_flow.empty:
-        op_cash = get_safe_value(cash_flow, 'Operating Cash Flow', is_column_data=False)
-        cap_ex = get_safe_value(cash_flow, 'Capital Expenditure', is_column_data=False)
+        op_cash = row_get(cash_flow, 'Operating Cash Flow', idx_set=cf_idx)
+        cap_ex = row_get(cash_flow, 'Capital Expenditure', idx_set=cf_idx)
         if isinstance(op_cash, pd.Series) and isinstance(cap_ex, pd.Series):
             aligned_op, aligned_ce = op_cash.align(cap_ex, join='inner')
-            if not aligned_op.empty and not aligned_ce.empty:
-                fcf_values = {yr: aligned_op[yr] + aligned_ce[yr] for yr in aligned_op.index if pd.notna(aligned_op[yr]) and pd.notna(aligned_ce[yr])}
-                if fcf_values: fcf_series = pd.Series(fcf_values)
-    growth_rates['fcf_cagr'] = calculate_cagr(fcf_series, years_to_consider)
+            fcf_values = _as_float_array(aligned_op) + _as_float_array(aligned_ce)
+            growth_rates['fcf_cagr'] = calculate_cagr_array(fcf_values, aligned_op.index.to_numpy(), years_to_consider)
     
     return clean_data(growth_rates)
 
@@ -131,26 +163,27 @@ def calculate_management_metrics_phil_town(stock_data):
     metrics = {}
     long_term_debt = None
     if not balance_sheet.empty:
-        latest_year_bs_data = balance_sheet.iloc[:, 0]
+        # Plain dict lookups are far cheaper than repeated Series.get on the column
+        latest_year_bs_data = balance_sheet.iloc[:, 0].to_dict()
         
-        long_term_debt = get_safe_value(latest_year_bs_data, 'Long Term Debt', is_column_data=True)
+        long_term_debt = latest_year_bs_data.get('Long Term Debt')
         if long_term_debt is None:
-            total_debt = get_safe_value(latest_year_bs_data, 'Total Debt', is_column_data=True)
-            current_debt = get_safe_value(latest_year_bs_data, 'Current Debt', is_column_data=True)
+            total_debt = latest_year_bs_data.get('Total Debt')
+            current_debt = latest_year_bs_data.get('Current Debt')
             if total_debt is not None and current_debt is not None: long_term_debt = total_debt - current_debt
             elif total_debt is not None: long_term_debt = total_debt
             else: long_term_debt = 0
     
     fcf_most_recent = None
     if not cash_flow.empty:
-        latest_year_cf_data = cash_flow.iloc[:, 0]
+        latest_year_cf_data = cash_flow.iloc[:, 0].to_dict()
         
-        op_cash = get_safe_value(latest_year_cf_data, 'Operating Cash Flow', is_column_data=True)
-        cap_ex = get_safe_value(latest_year_cf_data, 'Capital Expenditure', is_column_data=True)
+        op_cash = latest_year_cf_data.get('Operating Cash Flow')
+        cap_ex = latest_year_cf_data.get('Capital Expenditure')
         if op_cash is not None and cap_ex is not None: fcf_most_recent = op_cash + cap_ex
     
     metrics['debt_payoff_years'] = long_term_debt / fcf_most_recent if long_term_debt is not None and fcf_most_recent is not None and fcf_most_recent > 0 else None
-    metrics['insider_ownership'] = get_safe_value(info, 'heldPercentInsiders')
+    metrics['insider_ownership'] = dict_get(info, 'heldPercentInsiders')
     
     return clean_data(metrics)
 
@@ -158,15 +191,15 @@ def calculate_margin_of_safety_phil_town(stock_data, growth_rates_pt):
     
     info = stock_data["info"]
     mos_data = {}
-    current_eps = get_safe_value(info, 'trailingEps')
+    current_eps = dict_get(info, 'trailingEps')
     
     if current_eps is None or current_eps <= 0:
         mos_data['error'] = "Current EPS is not positive or unavailable, MOS calculation not suitable for Phil Town strategy."
         return clean_data(mos_data)
     mos_data['current_eps'] = current_eps
-    historical_eps_growth, analyst_eps_estimate = growth_rates_pt.get('eps_cagr'), get_safe_value(info, 'earningsGrowth')
+    historical_eps_growth, analyst_eps_estimate = growth_rates_pt.get('eps_cagr'), dict_get(info, 'earningsGrowth')
     
-    valid_growth_rates = [g for g in [historical_eps_growth, analyst_eps_estimate] if isinstance(g, (int, float))]
+    valid_growth_rates = [g for g in (historical_eps_growth, analyst_eps_estimate) if type(g) is float or type(g) is int]
     if not valid_growth_rates:
         mos_data['error'] = "Could not determine a reliable EPS growth rate for Phil Town MOS."
         return clean_data(mos_data)
@@ -176,84 +209,86 @@ def calculate_margin_of_safety_phil_town(stock_data, growth_rates_pt):
     mos_data['projected_eps_growth_rate'] = projected_eps_growth_rate
     future_eps = current_eps * ((1 + projected_eps_growth_rate) ** YEARS_TO_PROJECT)
     mos_data['future_eps'] = future_eps
-    pe_from_growth, current_trailing_pe = 2 * (projected_eps_growth_rate * 100), get_safe_value(info, 'trailingPE')
+    pe_from_growth, current_trailing_pe = 2 * (projected_eps_growth_rate * 100), dict_get(info, 'trailingPE')
     future_pe_options = [pe_from_growth]
     if isinstance(current_trailing_pe, (int, float)) and current_trailing_pe > 0: future_pe_options.append(current_trailing_pe)
     future_pe = min(future_pe_options) if future_pe_options else FUTURE_PE_CAP
     future_pe = min(future_pe, FUTURE_PE_CAP)
     if future_pe <= 0:
-        default_pe = get_safe_value(info, 'forwardPE')
+        default_pe = dict_get(info, 'forwardPE')
         future_pe = default_pe if isinstance(default_pe, (int, float)) and default_pe > 0 else 15.0
     mos_data['future_pe_ratio'] = future_pe
     sticker_price = (future_eps * future_pe) / ((1 + MIN_ACCEPTABLE_RETURN) ** YEARS_TO_PROJECT)
     mos_data['sticker_price'] = sticker_price
     mos_data['mos_price'] = sticker_price * 0.5
-    current_price_options = [get_safe_value(info, k) for k in ['regularMarketPrice', 'currentPrice', 'previousClose']]
-    mos_data['current_market_price'] = next((p for p in current_price_options if isinstance(p, (int, float))), None)
+    current_market_price = None
+    for price_key in ('regularMarketPrice', 'currentPrice', 'previousClose'):
+        price = info.get(price_key)
+        if isinstance(price, (int, float)): current_market_price = price; break
+    mos_data['current_market_price'] = current_market_price
     
     return clean_data(mos_data)
 
 # --- High-Growth Strategy Functions ---
+HIGH_GROWTH_INFO_FIELDS = (('current_psr', 'priceToSalesTrailing12Months'), ('current_per', 'trailingPE'), ('market_cap', 'marketCap'),
+                           ('shares_outstanding', 'sharesOutstanding'), ('ev_to_ebitda', 'enterpriseToEbitda'))
+
 def calculate_net_margins(financials_df, years_to_consider=YEARS_FOR_TREND_ANALYSIS):
-    print(f"[Analysis] calculate_net_margins: financials_df empty: {financials_df.empty}")
     net_income_series, total_revenue_series = None, None
     if not financials_df.empty:
-        net_income_series = get_safe_value(financials_df, 'Net Income', is_column_data=False)
-        total_revenue_series = get_safe_value(financials_df, 'Total Revenue', is_column_data=False)
-    print(f"[Analysis] calculate_net_margins: net_income_series empty: {net_income_series.empty if isinstance(net_income_series, pd.Series) else 'N/A'}, total_revenue_series empty: {total_revenue_series.empty if isinstance(total_revenue_series, pd.Series) else 'N/A'}")
+        net_income_series = row_get(financials_df, 'Net Income')
+        total_revenue_series = row_get(financials_df, 'Total Revenue')
     if not isinstance(net_income_series, pd.Series) or not isinstance(total_revenue_series, pd.Series) or net_income_series.empty or total_revenue_series.empty: return [], "N/A"
-    net_income_series_num, total_revenue_series_num = pd.to_numeric(net_income_series, 'coerce'), pd.to_numeric(total_revenue_series, 'coerce')
-    aligned_ni, aligned_rev = net_income_series_num.align(total_revenue_series_num, join='inner')
-    valid_mask = (aligned_rev != 0) & pd.notna(aligned_rev) & pd.notna(aligned_ni)
-    aligned_ni, aligned_rev = aligned_ni[valid_mask], aligned_rev[valid_mask]
-    if aligned_rev.empty: return [], "N/A"
-    net_margins_series = (aligned_ni / aligned_rev).sort_index(ascending=False)
-    recent_net_margins = net_margins_series.head(years_to_consider).iloc[::-1]
-    print(f"[Analysis] calculate_net_margins: recent_net_margins: {recent_net_margins.tolist()}")
+    aligned_ni, aligned_rev = net_income_series.align(total_revenue_series, join='inner')
+    order = np.argsort(aligned_ni.index.to_numpy(), kind='stable')
+    ni_values, rev_values = _as_float_array(aligned_ni)[order], _as_float_array(aligned_rev)[order]
+    valid_mask = (rev_values != 0) & ~np.isnan(rev_values) & ~np.isnan(ni_values)
+    if not valid_mask.any(): return [], "N/A"
+    net_margins = ni_values[valid_mask] / rev_values[valid_mask]
+    recent_net_margins = net_margins[max(net_margins.size - years_to_consider, 0):]
     trend = "Not enough data for trend"
-    if len(recent_net_margins) >= 2:
-        first_margin, last_margin = recent_net_margins.iloc[0], recent_net_margins.iloc[-1]
-        if isinstance(first_margin, (int,float)) and isinstance(last_margin, (int,float)):
-            if last_margin > first_margin: trend = "Expanding"
-            elif last_margin < first_margin: trend = "Contracting"
-            else: trend = "Stable"
-        else: trend = "Trend undetermined (non-numeric margins)"
-    print(f"[Analysis] calculate_net_margins: trend: {trend}")
+    if recent_net_margins.size >= 2:
+        # Least-squares slope over the window, so a single noisy endpoint does not flip the trend
+        x_centered = np.arange(recent_net_margins.size) - (recent_net_margins.size - 1) / 2
+        slope = float(x_centered @ recent_net_margins / (x_centered @ x_centered))
+        if slope > NET_MARGIN_TREND_TOLERANCE: trend = "Expanding"
+        elif slope < -NET_MARGIN_TREND_TOLERANCE: trend = "Contracting"
+        else: trend = "Stable"
+    logger.debug("calculate_net_margins: recent_net_margins=%s, trend=%s", recent_net_margins, trend)
     return recent_net_margins.tolist(), trend
 
 def analyze_high_growth_quality_strategy(stock_data, avg_roic_from_pt):
-    print(f"[Analysis] analyze_high_growth_quality_strategy: stock_data keys: {stock_data.keys()}, avg_roic_from_pt: {avg_roic_from_pt}")
-    info, financials, balance_sheet = stock_data["info"], stock_data["financials"], stock_data["balance_sheet"]
-    print(f"[Analysis] analyze_high_growth_quality_strategy: info present: {bool(info)}, financials empty: {financials.empty}, balance_sheet empty: {balance_sheet.empty}")
+    logger.debug("analyze_high_growth_quality_strategy: avg_roic_from_pt=%s", avg_roic_from_pt)
+    info, financials, balance_sheet = stock_data["info"] or {}, stock_data["financials"], stock_data["balance_sheet"]
+    fin_idx = frozenset(financials.index)
+    latest_bs = balance_sheet.iloc[:, 0].to_dict() if not balance_sheet.empty else {}
     analysis = {}
-    sales_series_hg = get_safe_value(financials, 'Total Revenue', is_column_data=False)
-    print(f"[Analysis] analyze_high_growth_quality_strategy: sales_series_hg empty: {sales_series_hg.empty if isinstance(sales_series_hg, pd.Series) else 'N/A'}")
+    sales_series_hg = row_get(financials, 'Total Revenue', idx_set=fin_idx)
     analysis['sales_cagr_hg'] = calculate_cagr(sales_series_hg, YEARS_FOR_TREND_ANALYSIS)
     net_margins_list, net_margin_trend = calculate_net_margins(financials, YEARS_FOR_TREND_ANALYSIS)
     analysis.update({'net_margins_historical': net_margins_list, 'net_margin_trend': net_margin_trend,
                      'current_net_margin': net_margins_list[-1] if net_margins_list and isinstance(net_margins_list[-1], (int,float)) else None})
-    analysis.update({k: get_safe_value(info, v) for k, v in {'current_psr': 'priceToSalesTrailing12Months', 'current_per': 'trailingPE',
-                     'market_cap': 'marketCap', 'shares_outstanding': 'sharesOutstanding', 'ev_to_ebitda': 'enterpriseToEbitda'}.items()})
+    analysis.update({k: info.get(v) for k, v in HIGH_GROWTH_INFO_FIELDS})
     net_debt = None
     if not balance_sheet.empty:
-        latest_bs_col = balance_sheet.iloc[:, 0]
-        total_debt, cash_equivalents = get_safe_value(latest_bs_col, 'Total Debt', True), get_safe_value(latest_bs_col, 'Cash And Cash Equivalents', True)
+        total_debt, cash_equivalents = latest_bs.get('Total Debt'), latest_bs.get('Cash And Cash Equivalents')
         if isinstance(total_debt, (int,float)) and isinstance(cash_equivalents, (int,float)): net_debt = total_debt - cash_equivalents
     analysis['net_debt'] = net_debt
-    ebitda = get_safe_value(info, 'ebitda')
+    ebitda = dict_get(info, 'ebitda')
     analysis['net_debt_to_ebitda'] = net_debt / ebitda if isinstance(net_debt,(int,float)) and isinstance(ebitda,(int,float)) and ebitda != 0 else None
     latest_roe = None
     if not balance_sheet.empty:
-        net_income_series_for_roe = get_safe_value(financials, 'Net Income', is_column_data=False)
+        net_income_series_for_roe = row_get(financials, 'Net Income', idx_set=fin_idx)
         if isinstance(net_income_series_for_roe, pd.Series) and not net_income_series_for_roe.empty:
-            numeric_ni_series = pd.to_numeric(net_income_series_for_roe, errors='coerce').dropna()
-            net_income_latest_val = numeric_ni_series.iloc[-1] if not numeric_ni_series.empty else None
-            equity_latest = get_safe_value(balance_sheet.iloc[:,0], 'Stockholders Equity', True)
+            numeric_ni_values = _as_float_array(net_income_series_for_roe)
+            numeric_ni_values = numeric_ni_values[~np.isnan(numeric_ni_values)]
+            net_income_latest_val = float(numeric_ni_values[-1]) if numeric_ni_values.size else None
+            equity_latest = latest_bs.get('Stockholders Equity')
             if isinstance(net_income_latest_val,(int,float)) and isinstance(equity_latest,(int,float)) and equity_latest != 0:
                 latest_roe = net_income_latest_val / equity_latest
-    analysis.update({'latest_roe': latest_roe, 'avg_roic': avg_roic_from_pt, 'insider_ownership_hg': get_safe_value(info, 'heldPercentInsiders')})
-    div_yield = get_safe_value(info, 'dividendYield')
+    analysis.update({'latest_roe': latest_roe, 'avg_roic': avg_roic_from_pt, 'insider_ownership_hg': dict_get(info, 'heldPercentInsiders')})
+    div_yield = dict_get(info, 'dividendYield')
     analysis['dividend_yield'] = div_yield
     analysis['pays_dividends'] = bool(stock_data.get('dividends') is not None and not stock_data['dividends'].empty and isinstance(div_yield, float) and div_yield > 0)
-    print(f"[Analysis] analyze_high_growth_quality_strategy: calculated analysis: {analysis}")
+    logger.debug("analyze_high_growth_quality_strategy: calculated analysis: %s", analysis)
     return clean_data(analysis)
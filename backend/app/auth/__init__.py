@@ -2,12 +2,14 @@
 Authentication utilities for Fundamint.
 """
 
-from .security import verify_password, get_password_hash
+from .security import verify_password, get_password_hash, averify_password, aget_password_hash
 from .jwt import create_access_token, create_refresh_token, decode_token
 
 __all__ = [
     "verify_password",
     "get_password_hash",
+    "averify_password",
+    "aget_password_hash",
     "create_access_token",
     "create_refresh_token",
     "decode_token",
@@ -2,11 +2,17 @@
 JWT token creation and verification utilities.
 """
 
+import base64
+import hashlib
+import hmac
+import json
 import os
+from calendar import timegm
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Literal, Optional
+from uuid import UUID
 from jose import JWTError, jwt
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,13 +22,21 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your-super-secret-key-change-in-production
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 REFRESH_TOKEN_EXPIRE_DAYS = 7
+ACCESS_TOKEN_EXPIRE_DELTA = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+REFRESH_TOKEN_EXPIRE_DELTA = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+
+SECRET_KEY_BYTES = SECRET_KEY.encode("utf-8")
+# The HS256 header never changes, so its base64url segment is built once
+_HS256_HEADER_SEGMENT = base64.urlsafe_b64encode(
+    json.dumps({"alg": ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode("utf-8")
+).rstrip(b"=")
 
 
 class TokenData(BaseModel):
-    """Data contained within a JWT token."""
-    user_id: str | None = None
+    """Data contained within a JWT token; an instance is only built from a well-formed payload."""
+    user_id: UUID
     email: str | None = None
-    token_type: str = "access"
+    token_type: Literal["access", "refresh"] = "access"
 
 
 class TokenPayload(BaseModel):
@@ -32,6 +46,32 @@ class TokenPayload(BaseModel):
     token_type: str = "bearer"
 
 
+def _hs256_encode(payload: dict) -> str:
+    """
+    Sign a JWT with HS256.
+    
+    Produces the same token as ``jwt.encode(payload, SECRET_KEY, algorithm="HS256")``
+    but skips jose's per-call algorithm/key lookups. Tokens are still decoded
+    and verified with jose in ``decode_token``.
+    
+    Args:
+        payload: The claims to encode; datetime claims are converted to epoch seconds
+        
+    Returns:
+        The encoded JWT token string
+    """
+    claims = {
+        key: timegm(value.utctimetuple()) if isinstance(value, datetime) else value
+        for key, value in payload.items()
+    }
+    payload_segment = base64.urlsafe_b64encode(
+        json.dumps(claims, separators=(",", ":")).encode("utf-8")
+    ).rstrip(b"=")
+    signing_input = _HS256_HEADER_SEGMENT + b"." + payload_segment
+    signature = hmac.new(SECRET_KEY_BYTES, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + base64.urlsafe_b64encode(signature).rstrip(b"=")).decode("ascii")
+
+
 def create_access_token(
     data: dict,
     expires_delta: Optional[timedelta] = None
@@ -48,18 +88,17 @@ def create_access_token(
     """
     to_encode = data.copy()
     
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    # Single clock read so iat/exp are consistent; claims go in as epoch seconds
+    now = datetime.now(timezone.utc)
+    expire = now + (expires_delta or ACCESS_TOKEN_EXPIRE_DELTA)
     
     to_encode.update({
-        "exp": expire,
+        "exp": int(expire.timestamp()),
         "type": "access",
-        "iat": datetime.now(timezone.utc),
+        "iat": int(now.timestamp()),
     })
     
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = _hs256_encode(to_encode)
     return encoded_jwt
 
 
@@ -79,18 +118,17 @@ def create_refresh_token(
     """
     to_encode = data.copy()
     
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    # Single clock read so iat/exp are consistent; claims go in as epoch seconds
+    now = datetime.now(timezone.utc)
+    expire = now + (expires_delta or REFRESH_TOKEN_EXPIRE_DELTA)
     
     to_encode.update({
-        "exp": expire,
+        "exp": int(expire.timestamp()),
         "type": "refresh",
-        "iat": datetime.now(timezone.utc),
+        "iat": int(now.timestamp()),
     })
     
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = _hs256_encode(to_encode)
     return encoded_jwt
 
 
@@ -106,13 +144,13 @@ def decode_token(token: str) -> Optional[TokenData]:
     """
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        email: str = payload.get("email")
-        token_type: str = payload.get("type", "access")
         
-        if user_id is None:
-            return None
-            
-        return TokenData(user_id=user_id, email=email, token_type=token_type)
-    except JWTError:
+        # Validation rejects a missing or malformed subject and unknown token types;
+        # the subject is parsed into a UUID once here, not on every lookup
+        return TokenData(
+            user_id=payload.get("sub"),
+            email=payload.get("email"),
+            token_type=payload.get("type", "access"),
+        )
+    except (JWTError, ValidationError):
         return None
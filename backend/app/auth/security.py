@@ -2,12 +2,31 @@
 Password hashing and verification utilities using bcrypt.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# bcrypt cost factor (2^rounds iterations); passlib's default is 12
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
 
 # Configure password hashing context
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+)
+
+# Dedicated pool for bcrypt work: the C backend releases the GIL, so hashes
+# run in parallel without blocking the event loop or starving the default
+# executor used for other blocking calls.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt",
 )
 
 
@@ -36,3 +55,32 @@ def get_password_hash(password: str) -> str:
         The hashed password
     """
     return pwd_context.hash(password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password without blocking the event loop.
+    
+    Args:
+        plain_password: The password in plain text
+        hashed_password: The hashed password to compare against
+        
+    Returns:
+        True if the password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, pwd_context.verify, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Hash a password without blocking the event loop.
+    
+    Args:
+        password: The password to hash
+        
+    Returns:
+        The hashed password
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, pwd_context.hash, password)
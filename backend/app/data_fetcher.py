@@ -1,10 +1,20 @@
 
+import asyncio
+import base64
+import io
+import os
+import threading
+import time
 import yfinance as yf
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+import orjson
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import date, datetime, timedelta
 from functools import lru_cache
+from importlib.util import find_spec
 
 # Import FMP fallback fetcher
 try:
@@ -20,48 +30,74 @@ CACHE_MAXSIZE = 128
 CACHE_TTL_SECONDS = 300  # 5 minutes
 
 # --- Fallback Libraries (Optional) ---
-try:
-    from investiny import search_assets
-    from investiny.info import overview as investiny_overview
-    from investiny.fundamentus import financial_summary as investiny_financial_summary
-    investiny_available = True
-except ImportError:
-    investiny_available = False
-    def search_assets(*args, **kwargs): return []
-    def investiny_overview(*args, **kwargs): return {}
-    def investiny_financial_summary(*args, **kwargs): return pd.DataFrame()
+# Only probed here; each library is imported on first use, so workers that never
+# leave the yfinance happy path don't pay for importing them.
+def _module_available(name: str) -> bool:
+    try: return find_spec(name) is not None
+    except (ImportError, ValueError): return False
 
-try:
-    import fix_yahoo_finance as fyf
-except ImportError:
-    fyf = None
+investiny_available = _module_available("investiny")
+fyf_available = _module_available("fix_yahoo_finance")
+finviz_available = _module_available("finvizfinance")
 
-try:
-    from finvizfinance.stock import Stock as FinvizStock
-    finviz_available = True
-except ImportError:
-    finviz_available = False
-    def FinvizStock(*args, **kwargs): return None
+def search_assets(*args, **kwargs):
+    if not investiny_available: return []
+    from investiny import search_assets as _search_assets
+    return _search_assets(*args, **kwargs)
+
+def investiny_overview(*args, **kwargs):
+    if not investiny_available: return {}
+    from investiny.info import overview
+    return overview(*args, **kwargs)
+
+def investiny_financial_summary(*args, **kwargs):
+    if not investiny_available: return pd.DataFrame()
+    from investiny.fundamentus import financial_summary
+    return financial_summary(*args, **kwargs)
+
+def FinvizStock(*args, **kwargs):
+    if not finviz_available: return None
+    from finvizfinance.stock import Stock
+    return Stock(*args, **kwargs)
+
+# --- Shared Cache (Optional) ---
+parquet_available = _module_available("pyarrow")  # Parquet engine used to store price history compactly in the shared cache
 
 # --- Configuration ---
 YEARS_OF_DATA = 10
 
 # --- Helper Functions ---
+_SUFFIX_MULTIPLIERS = {'B': 1e9, 'b': 1e9, 'M': 1e6, 'm': 1e6, 'K': 1e3, 'k': 1e3}
+_MISSING_VALUE_STRINGS = frozenset({'', '-', 'n/a', 'N/A', 'N/a', 'n/A'})
+_STRIP_THOUSANDS_SEPARATOR = str.maketrans('', '', ',')
+
 def convert_financial_string_to_float(value_str):
     if isinstance(value_str, (int, float)): return float(value_str)
     if not isinstance(value_str, str): return None
-    value_str = value_str.replace(',', '').strip()
-    if not value_str or value_str.lower() == 'n/a' or value_str == '-': return None
-    multiplier = 1.0; is_percentage = False
-    if value_str.endswith('%'): is_percentage = True; value_str = value_str[:-1]
-    elif value_str.upper().endswith('B'): multiplier = 1e9; value_str = value_str[:-1]
-    elif value_str.upper().endswith('M'): multiplier = 1e6; value_str = value_str[:-1]
-    elif value_str.upper().endswith('K'): multiplier = 1e3; value_str = value_str[:-1]
+    value_str = value_str.translate(_STRIP_THOUSANDS_SEPARATOR).strip()
+    if value_str in _MISSING_VALUE_STRINGS: return None
+    last_char = value_str[-1]
     try:
-        numeric_val = float(value_str)
-        return numeric_val / 100.0 if is_percentage else numeric_val * multiplier
+        if last_char == '%': return float(value_str[:-1]) / 100.0
+        multiplier = _SUFFIX_MULTIPLIERS.get(last_char)
+        if multiplier: return float(value_str[:-1]) * multiplier
+        return float(value_str)
     except ValueError: return None
 
+FINANCIAL_SUFFIX_MULTIPLIERS = {'%': 0.01, 'B': 1e9, 'M': 1e6, 'K': 1e3}
+
+def convert_financial_series_to_float(series: pd.Series) -> pd.Series:
+    # Vectorized counterpart of convert_financial_string_to_float; unparseable entries become NaN
+    if pd.api.types.is_numeric_dtype(series): return series.astype(float)
+    try: text = series.str.replace(',', '', regex=False).str.strip()  # NaN for non-string entries
+    except AttributeError: return pd.to_numeric(series, errors='coerce').astype(float)  # No strings at all
+    suffix = text.str[-1:].str.upper()
+    has_suffix = suffix.isin(FINANCIAL_SUFFIX_MULTIPLIERS.keys())
+    parsed = pd.to_numeric(text.where(~has_suffix, text.str[:-1]), errors='coerce') * suffix.map(FINANCIAL_SUFFIX_MULTIPLIERS).fillna(1.0)
+    # Entries that were already numbers pass straight through
+    numeric = pd.to_numeric(series.where(text.isna()), errors='coerce')
+    return parsed.fillna(numeric).astype(float)
+
 def get_safe_value(data_structure, key, is_column_data=False):
     if data_structure is None: return None
     if isinstance(data_structure, dict): return data_structure.get(key)
@@ -69,24 +105,47 @@ def get_safe_value(data_structure, key, is_column_data=False):
         if not isinstance(data_structure, pd.Series): return None
         return data_structure.get(key)
     if isinstance(data_structure, pd.DataFrame):
-        if key in data_structure.index: return data_structure.loc[key]
-        return None
+        # Index.get_loc hits the index's cached hash table; positional iloc skips .loc's label dispatch
+        try: return data_structure.iloc[data_structure.index.get_loc(key)]
+        except KeyError: return None
     if isinstance(data_structure, pd.Series): return data_structure.get(key)
     return None
 
 # --- Fallback Helpers ---
-asset_id_cache: Dict[str, str] = {} # Global cache for investiny asset IDs
+# (provider field name, yfinance info key) pairs used to fill gaps left by yfinance
+INVESTINY_INFO_FIELDS = (('EPS (TTM)', 'trailingEps'), ('Market Cap', 'marketCap'), ('P/E Ratio', 'trailingPE'),
+                         ('Dividend (Yield)', 'dividendYield'), ('Prev. Close', 'previousClose'), ('EBITDA', 'ebitda'),
+                         ('Name', 'longName'))
+FINVIZ_INFO_FIELDS = (('P/E', 'trailingPE'), ('EPS (ttm)', 'trailingEps'), ('Market Cap', 'marketCap'), ('Dividend %', 'dividendYield'),
+                      ('P/S', 'priceToSalesTrailing12Months'), ('Insider Own', 'heldPercentInsiders'), ('Inst Own', 'heldPercentInstitutions'))
+
+def _missing_info_fields(info: Dict[str, Any], fields: Tuple[Tuple[str, str], ...]) -> List[Tuple[str, str]]:
+    return [(source_key, yf_key) for source_key, yf_key in fields if info.get(yf_key) is None]
+
+ASSET_ID_CACHE_MAXSIZE = 4096
+
+@lru_cache(maxsize=ASSET_ID_CACHE_MAXSIZE)
+def _lookup_investiny_asset_id(ticker: str) -> Optional[str]:
+    # Tickers investiny does not know are cached as None too; search errors propagate so they are retried
+    results = search_assets(query=ticker, limit=1, type="stock")
+    if results and isinstance(results, list): return results[0].get("id_") or None
+    return None
 
 def get_investiny_asset_id(ticker: str) -> Optional[str]:
-    if ticker in asset_id_cache: return asset_id_cache[ticker]
     if not investiny_available: return None
-    try:
-        results = search_assets(query=ticker, limit=1, type="stock")
-        if results and isinstance(results, list) and len(results) > 0:
-            asset_id = results[0].get("id_")
-            if asset_id: asset_id_cache[ticker] = asset_id; return asset_id
-    except Exception as e: pass # Suppress error message
-    return None
+    try: return _lookup_investiny_asset_id(ticker)
+    except Exception as e: return None # Suppress error message
+
+def invalidate_investiny_asset_ids() -> None:
+    _lookup_investiny_asset_id.cache_clear()
+
+def _fetch_investiny_overview(ticker: str) -> Optional[Dict[str, Any]]:
+    asset_id = get_investiny_asset_id(ticker)
+    if not asset_id: return None
+    return investiny_overview(asset_id=asset_id)
+
+def _fetch_finviz_stock(ticker: str) -> Optional[Dict[str, Any]]:
+    return FinvizStock(ticker).get_stock()
 
 def get_series_from_investiny_summary(ticker: str, investiny_column_name: str, target_metric_name: str) -> Optional[pd.Series]:
     if not investiny_available: return None
@@ -98,37 +157,223 @@ def get_series_from_investiny_summary(ticker: str, investiny_column_name: str, t
         if not (isinstance(financial_data, pd.DataFrame) and not financial_data.empty): return None
         summary_df = financial_data
         if investiny_column_name in summary_df.columns:
-            series = summary_df[investiny_column_name].copy()
-            series.index = pd.to_datetime(series.index, errors='coerce')
-            series = series.dropna().sort_index()
-            converted_values = [convert_financial_string_to_float(val) for val in series.values]
-            valid_indices = [idx for idx, val in zip(series.index, converted_values) if val is not None]
-            valid_converted_values = [val for val in converted_values if val is not None]
-            if valid_converted_values:
-                series = pd.Series(valid_converted_values, index=pd.Index(valid_indices, dtype='datetime64[ns]'))
-                if not series.empty: return series
+            column = summary_df[investiny_column_name]
+            dates = pd.to_datetime(column.index, errors='coerce').as_unit('ns')
+            converted = convert_financial_series_to_float(column.set_axis(dates))
+            valid = converted.notna().to_numpy()
+            if valid.any(): return converted[valid].sort_index()
     except Exception as e: pass # Suppress error message
     return None
 
 # --- Cache configuration ---
 CACHE_MAXSIZE = 128
-CACHE_TTL_SECONDS = 300  # 5 minutes
+CACHE_TTL_SECONDS = 300  # 5 minutes; quote/info lane and the assembled payload
+HISTORY_CACHE_TTL_SECONDS = 900  # 15 minutes
+STATEMENTS_CACHE_TTL_SECONDS = 86400  # 24 hours; statements only change with new filings
+# yfinance info is only trusted when it carries at least one of these
+YF_PRICE_INFO_KEYS = frozenset(('regularMarketPrice', 'currentPrice', 'previousClose', 'longName'))
+YF_STATEMENT_ATTRIBUTES = ("financials", "balance_sheet", "cash_flow", "major_holders", "dividends", "actions")
+# Statements a result must carry before it is kept in the 24-hour lane
+YF_REQUIRED_STATEMENTS = ("financials", "balance_sheet", "cash_flow")
+
+# Shared cache across uvicorn workers; only used when REDIS_URL is set and redis is installed
+REDIS_URL = os.getenv("REDIS_URL")
+def _create_redis_client():
+    if not REDIS_URL: return None
+    try: import redis
+    except ImportError: return None
+    return redis.Redis.from_url(REDIS_URL)
+
+_redis_client = _create_redis_client()
+
+# Worker threads for running the blocking fetch cascade from async code
+BATCH_FETCH_MAX_WORKERS = 16
+_fetch_executor = ThreadPoolExecutor(max_workers=BATCH_FETCH_MAX_WORKERS, thread_name_prefix="stock-fetch")
+
+# Separate pool for the fallback providers queried concurrently inside a single cascade
+PROVIDER_FETCH_MAX_WORKERS = 8
+PROVIDER_FETCH_TIMEOUT_SECONDS = 20
+_provider_executor = ThreadPoolExecutor(max_workers=PROVIDER_FETCH_MAX_WORKERS, thread_name_prefix="provider-fetch")
+
+# Dedicated pool for the per-attribute yfinance statement scrapes, sized so a handful of tickers can be
+# scraped at once without their requests queueing behind each other or behind the fallback providers
+STATEMENT_FETCH_MAX_WORKERS = len(YF_STATEMENT_ATTRIBUTES) * 4
+_statement_executor = ThreadPoolExecutor(max_workers=STATEMENT_FETCH_MAX_WORKERS, thread_name_prefix="statement-fetch")
+
+# Shared, read-only placeholders for missing tables in returned payloads
+_EMPTY_FRAME = pd.DataFrame()
+_EMPTY_SERIES = pd.Series(dtype=float)
+STOCK_DATA_TABLE_KEYS = ("financials", "balance_sheet", "cash_flow", "major_holders", "dividends", "actions", "history")
+
+def _empty_table(key: str):
+    return _EMPTY_SERIES if key == "dividends" else _EMPTY_FRAME
+
+def _non_empty(table):
+    return table if table is not None and not table.empty else None
+
+def _empty_stock_data(data_source: str = "unknown") -> Dict[str, Any]:
+    data: Dict[str, Any] = {"info": {}}
+    for key in STOCK_DATA_TABLE_KEYS: data[key] = _empty_table(key)
+    data["data_source"] = data_source
+    return data
+
+def _cache_timestamp(ttl_seconds: int = CACHE_TTL_SECONDS) -> int:
+    # Use integer division to get the number of full cache intervals since epoch
+    return int(datetime.now().timestamp() // ttl_seconds) * ttl_seconds
+
+class IncompleteStatementsError(LookupError):
+    """Raised when required statements are missing or a scrape failed; carries the ones that were fetched."""
+    def __init__(self, ticker_symbol: str, statements: Dict[str, Any]):
+        super().__init__(f"Incomplete statements for {ticker_symbol}")
+        self.statements = statements
+
+# Slow-moving yfinance data is cached in its own lanes so a quote refresh does not re-download it.
+# Empty results raise LookupError, which lru_cache does not store, so failures are retried on the next call.
+# Partial statements (a required one missing, or any scrape that failed or timed out) raise
+# IncompleteStatementsError the same way: they are still used, but only live as long as the assembled
+# payload (CACHE_TTL_SECONDS) instead of a whole day.
+@lru_cache(maxsize=CACHE_MAXSIZE)
+def _fetch_yf_statements_cached(ticker_symbol: str, _timestamp: int) -> Dict[str, Any]:
+    stock_yf = yf.Ticker(ticker_symbol)
+    statements: Dict[str, Any] = {}
+    # Each attribute is its own Yahoo request, so scrape them concurrently
+    attribute_futures = {_statement_executor.submit(getattr, stock_yf, key): key for key in YF_STATEMENT_ATTRIBUTES}
+    done, not_done = wait(attribute_futures, timeout=PROVIDER_FETCH_TIMEOUT_SECONDS)
+    for future in not_done: future.cancel()
+    failed = bool(not_done)
+    for future in done:
+        try:
+            attr_val = future.result()
+            if attr_val is not None and not attr_val.empty: statements[attribute_futures[future]] = attr_val
+        except Exception: failed = True
+    if not statements: raise LookupError(f"No statements returned for {ticker_symbol}")
+    if failed or not all(key in statements for key in YF_REQUIRED_STATEMENTS): raise IncompleteStatementsError(ticker_symbol, statements)
+    return statements
+
+def _fetch_yf_statements(ticker_symbol: str) -> Dict[str, Any]:
+    try: return _fetch_yf_statements_cached(ticker_symbol, _cache_timestamp(STATEMENTS_CACHE_TTL_SECONDS))
+    except IncompleteStatementsError as e: return e.statements
+
+@lru_cache(maxsize=CACHE_MAXSIZE)
+def _fetch_yf_history_cached(ticker_symbol: str, _timestamp: int) -> pd.DataFrame:
+    hist_data = yf.Ticker(ticker_symbol).history(period=f"{YEARS_OF_DATA+1}y")
+    if hist_data is None or hist_data.empty: raise LookupError(f"No price history returned for {ticker_symbol}")
+    return hist_data
+
+# Tickers for which the whole cascade came back without a symbol, mapped to when that happened
+NEGATIVE_CACHE_TTL_SECONDS = 60
+NEGATIVE_CACHE_MAXSIZE = 1024
+_negative_cache: Dict[str, float] = {}
+
+def _remember_invalid_ticker(ticker_symbol: str) -> None:
+    now = time.monotonic()
+    if len(_negative_cache) >= NEGATIVE_CACHE_MAXSIZE:
+        for ticker, failed_at in list(_negative_cache.items()):
+            if now - failed_at >= NEGATIVE_CACHE_TTL_SECONDS: _negative_cache.pop(ticker, None)
+        if len(_negative_cache) >= NEGATIVE_CACHE_MAXSIZE: _negative_cache.pop(next(iter(_negative_cache)), None)
+    _negative_cache[ticker_symbol] = now
+
+def _is_known_invalid_ticker(ticker_symbol: str) -> bool:
+    failed_at = _negative_cache.get(ticker_symbol)
+    return failed_at is not None and time.monotonic() - failed_at < NEGATIVE_CACHE_TTL_SECONDS
+
+def _shared_cache_key(ticker_symbol: str, timestamp: int) -> str:
+    return f"stk:{ticker_symbol}:{timestamp}"
+
+# Entries are JSON, never pickle, so a shared Redis can only ever hand back data, not code.
+# A value JSON cannot carry exactly makes encoding fail, so that payload is not shared rather than
+# shared in altered form. Floats are written in their shortest round-trip form, so they decode
+# bit-for-bit; datetimes travel as integer ticks plus their dtype, so units and time zones survive.
+def _reject_unserializable(value: Any) -> Any:
+    raise TypeError(f"{type(value).__name__} is not stored in the shared cache")
+
+def _dump_shared_cache_json(value: Any) -> bytes:
+    return orjson.dumps(value, default=_reject_unserializable, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+def _encode_values(values, name: Any = None) -> Dict[str, Any]:
+    ticks = values.dtype.kind == "M"
+    return {"dtype": str(values.dtype), "name": name,
+            "values": pd.DatetimeIndex(values).asi8.tolist() if ticks else values.tolist()}
+
+def _decode_values(entry: Dict[str, Any]) -> pd.Index:
+    return pd.Index(entry["values"], name=entry["name"]).astype(entry["dtype"])
+
+def _encode_table(table) -> Dict[str, Any]:
+    is_series = isinstance(table, pd.Series)
+    frame = table.to_frame() if is_series else table
+    # Column labels travel once, in "columns"; the data columns are positional
+    return {"series": is_series, "index": _encode_values(frame.index, frame.index.name),
+            "columns": _encode_values(frame.columns, frame.columns.name),
+            "data": [_encode_values(frame.iloc[:, position]) for position in range(frame.shape[1])]}
+
+def _decode_table(entry: Dict[str, Any]):
+    if "parquet" in entry: return pd.read_parquet(io.BytesIO(base64.b64decode(entry["parquet"])))
+    frame = pd.DataFrame({position: _decode_values(column).array for position, column in enumerate(entry["data"])},
+                         index=_decode_values(entry["index"]))
+    frame.columns = _decode_values(entry["columns"])
+    return frame.iloc[:, 0] if entry["series"] else frame
+
+def _encode_shared_cache_entry(data: Dict[str, Any]) -> bytes:
+    tables: Dict[str, Any] = {}
+    for key in STOCK_DATA_TABLE_KEYS:
+        table = data.get(key)
+        if table is None or table.empty: continue  # Decoded back to the shared empty placeholders
+        if key == "history" and parquet_available:
+            # Price history dominates the payload; store it as zstd-compressed Parquet when pyarrow is available
+            buffer = io.BytesIO()
+            table.to_parquet(buffer, compression="zstd")
+            tables[key] = {"parquet": base64.b64encode(buffer.getvalue()).decode()}
+        else: tables[key] = _encode_table(table)
+    fields = {key: value for key, value in data.items() if key not in STOCK_DATA_TABLE_KEYS}
+    return _dump_shared_cache_json({**fields, "tables": tables})
+
+def _decode_shared_cache_entry(blob: bytes) -> Dict[str, Any]:
+    data = orjson.loads(blob)
+    tables = data.pop("tables")
+    for key in STOCK_DATA_TABLE_KEYS:
+        data[key] = _decode_table(tables[key]) if key in tables else _empty_table(key)
+    return data
+
+def _shared_cache_get_many(keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+    # A single MGET round trip for all keys; any Redis failure is treated as a miss
+    if _redis_client is None or not keys: return [None] * len(keys)
+    try:
+        blobs = _redis_client.mget(keys)
+        return [_decode_shared_cache_entry(blob) if blob else None for blob in blobs]
+    except Exception: return [None] * len(keys)
+
+def _shared_cache_set(key: str, data: Dict[str, Any]) -> None:
+    if _redis_client is None: return
+    try: _redis_client.setex(key, CACHE_TTL_SECONDS, _encode_shared_cache_entry(data))
+    except Exception: pass
 
 @lru_cache(maxsize=CACHE_MAXSIZE)
 def _fetch_stock_data_cached(ticker_symbol: str, _timestamp: int) -> Dict[str, Any]:
     # The _timestamp argument is used to control cache invalidation.
     # It's not directly used in data fetching but changes when the cache should be cleared.
+    # The in-process lru_cache sits in front of the shared Redis cache, which sits in front of the providers.
+    key = _shared_cache_key(ticker_symbol, _timestamp)
+    data = _shared_cache_get_many([key])[0]
+    if data is None:
+        data = _fetch_stock_data_upstream(ticker_symbol)
+        if not data["info"].get("symbol"): _remember_invalid_ticker(ticker_symbol)
+        _shared_cache_set(key, data)
+    return data
+
+def _fetch_stock_data_upstream(ticker_symbol: str) -> Dict[str, Any]:
+    # Tables stay None until a provider returns a non-empty one; empties are filled in on return
     data: Dict[str, Any] = {
         "info": {},
-        "financials": pd.DataFrame(),
-        "balance_sheet": pd.DataFrame(),
-        "cash_flow": pd.DataFrame(),
-        "major_holders": pd.DataFrame(),
-        "dividends": pd.Series(dtype=float),
-        "actions": pd.DataFrame(),
-        "history": pd.DataFrame(),
+        "financials": None,
+        "balance_sheet": None,
+        "cash_flow": None,
+        "major_holders": None,
+        "dividends": None,
+        "actions": None,
+        "history": None,
         "data_source": "unknown"  # Track which API provided the data
     }
+    ticker_upper = ticker_symbol.upper()
     yfinance_primary_fetch_successful = False
     fyf_used_for_core = False
     data_sources_used = []
@@ -137,53 +382,69 @@ def _fetch_stock_data_cached(ticker_symbol: str, _timestamp: int) -> Dict[str, A
     try:
         stock_yf = yf.Ticker(ticker_symbol)
         stock_info_yf = stock_yf.info
-        if stock_info_yf and stock_info_yf.get('symbol', '').upper() == ticker_symbol.upper() and \
-           any(k in stock_info_yf for k in ['regularMarketPrice', 'currentPrice', 'previousClose', 'longName']):
+        info_symbol = stock_info_yf.get('symbol') if stock_info_yf else None
+        if info_symbol and info_symbol.upper() == ticker_upper and not YF_PRICE_INFO_KEYS.isdisjoint(stock_info_yf):
             data["info"] = stock_info_yf
-            for key in ["financials", "balance_sheet", "cash_flow", "major_holders", "dividends", "actions"]:
-                try:
-                    attr_val = getattr(stock_yf, key)
-                    if attr_val is not None and not attr_val.empty: data[key] = attr_val
-                except Exception: pass
-            hist_data = stock_yf.history(period=f"{YEARS_OF_DATA+1}y")
-            if hist_data is not None and not hist_data.empty: data["history"] = hist_data
-            if not data["financials"].empty and not data["balance_sheet"].empty: 
+            # Statements and price history come from their own longer-lived cache lanes
+            try: data.update(_fetch_yf_statements(ticker_symbol))
+            except LookupError: pass
+            try: data["history"] = _fetch_yf_history_cached(ticker_symbol, _cache_timestamp(HISTORY_CACHE_TTL_SECONDS))
+            except LookupError: pass
+            if data["financials"] is not None and data["balance_sheet"] is not None:
                 yfinance_primary_fetch_successful = True
                 data_sources_used.append("yfinance")
-        else:
-            hist_check = stock_yf.history(period="5d")
-            if hist_check.empty and (not stock_info_yf or not stock_info_yf.get('symbol')):
-                pass # Suppress error message
-            elif not stock_info_yf or not stock_info_yf.get('symbol'):
+        elif not info_symbol:
+            # No price history either means an invalid ticker; otherwise keep the partial info and the history
+            try:
+                data["history"] = _fetch_yf_history_cached(ticker_symbol, _cache_timestamp(HISTORY_CACHE_TTL_SECONDS))
                 data["info"] = stock_info_yf if stock_info_yf else {}
+            except LookupError: pass
     except Exception as e_yf: pass
 
     # 2. Fallback to fix-yahoo-finance if yfinance failed for core data
-    if not yfinance_primary_fetch_successful and fyf:
+    if not yfinance_primary_fetch_successful and fyf_available:
         try:
+            import fix_yahoo_finance as fyf
             stock_fyf = fyf.Ticker(ticker_symbol)
             fyf_info = stock_fyf.info
             if isinstance(fyf_info, dict) and fyf_info.get('symbol'): data["info"] = fyf_info
             for key, fyf_attr_name in [("financials", "financials"), ("balance_sheet", "balance_sheet"), ("cash_flow", "cashflow")]:
-                if data[key].empty:
-                    fyf_df = getattr(stock_fyf, fyf_attr_name, pd.DataFrame())
+                if data[key] is None:
+                    fyf_df = getattr(stock_fyf, fyf_attr_name, None)
                     if isinstance(fyf_df, pd.DataFrame) and not fyf_df.empty: data[key] = fyf_df; fyf_used_for_core = True
             if fyf_used_for_core: 
                 yfinance_primary_fetch_successful = True
                 data_sources_used.append("yfinance")
-            if data["history"].empty:
-                hist_data_fyf = stock_fyf.history(period=f"{YEARS_OF_DATA+1}y")
-                if hist_data_fyf is not None and not hist_data_fyf.empty: data["history"] = hist_data_fyf
+            if data["history"] is None:
+                data["history"] = _non_empty(stock_fyf.history(period=f"{YEARS_OF_DATA+1}y"))
         except Exception as e_fyf:
             pass
 
-    # 3. NEW: Fallback to Financial Modeling Prep API if yfinance failed
+    # 3-5. The remaining providers are independent network calls, so run them concurrently
+    # and merge afterwards in the original priority order (FMP, investiny, finviz).
+    provider_futures: Dict[Future, str] = {}
     if not yfinance_primary_fetch_successful and fmp_available:
+        provider_futures[_provider_executor.submit(fetch_stock_data_fmp, ticker_symbol)] = "fmp"
+    if investiny_available and _missing_info_fields(data["info"], INVESTINY_INFO_FIELDS):
+        provider_futures[_provider_executor.submit(_fetch_investiny_overview, ticker_symbol)] = "investiny"
+    if finviz_available and (_missing_info_fields(data["info"], FINVIZ_INFO_FIELDS)
+                             or not data["info"].get('sector') or not data["info"].get('industry')):
+        provider_futures[_provider_executor.submit(_fetch_finviz_stock, ticker_symbol)] = "finviz"
+
+    provider_results: Dict[str, Any] = {}
+    try:
+        for future in as_completed(provider_futures, timeout=PROVIDER_FETCH_TIMEOUT_SECONDS):
+            try: provider_results[provider_futures[future]] = future.result()
+            except Exception: pass
+    except FuturesTimeoutError:
+        pass # Providers that did not answer in time are skipped
+
+    # 3. Fallback to Financial Modeling Prep API if yfinance failed
+    fmp_data = provider_results.get("fmp")
+    if fmp_data:
         try:
-            fmp_data = fetch_stock_data_fmp(ticker_symbol)
-            
             # Check if FMP returned valid data
-            if fmp_data and fmp_data.get("info", {}).get("symbol"):
+            if fmp_data.get("info", {}).get("symbol"):
                 # Merge FMP data into our data structure
                 if not data["info"].get("symbol"):
                     data["info"] = fmp_data.get("info", {})
@@ -194,19 +455,11 @@ def _fetch_stock_data_cached(ticker_symbol: str, _timestamp: int) -> Dict[str, A
                             data["info"][key] = value
                 
                 # Use FMP financial statements if yfinance didn't have them
-                if data["financials"].empty and not fmp_data.get("financials", pd.DataFrame()).empty:
-                    data["financials"] = fmp_data["financials"]
-                if data["balance_sheet"].empty and not fmp_data.get("balance_sheet", pd.DataFrame()).empty:
-                    data["balance_sheet"] = fmp_data["balance_sheet"]
-                if data["cash_flow"].empty and not fmp_data.get("cash_flow", pd.DataFrame()).empty:
-                    data["cash_flow"] = fmp_data["cash_flow"]
-                if data["history"].empty and not fmp_data.get("history", pd.DataFrame()).empty:
-                    data["history"] = fmp_data["history"]
-                if data["dividends"].empty and not fmp_data.get("dividends", pd.Series(dtype=float)).empty:
-                    data["dividends"] = fmp_data["dividends"]
+                for key in ("financials", "balance_sheet", "cash_flow", "history", "dividends"):
+                    if data[key] is None: data[key] = _non_empty(fmp_data.get(key))
                 
                 # Mark that we used FMP
-                if not data["financials"].empty or data["info"].get("symbol"):
+                if data["financials"] is not None or data["info"].get("symbol"):
                     data_sources_used.append("financial_modeling_prep")
                     yfinance_primary_fetch_successful = True  # Allow other fallbacks to fill gaps
                     
@@ -214,51 +467,30 @@ def _fetch_stock_data_cached(ticker_symbol: str, _timestamp: int) -> Dict[str, A
             pass
 
     # 4. Fallback to investiny for missing info fields
-    if investiny_available:
-        investiny_info_map = {'EPS (TTM)': 'trailingEps', 'Market Cap': 'marketCap', 'P/E Ratio': 'trailingPE',
-                              'Dividend (Yield)': 'dividendYield', 'Prev. Close': 'previousClose', 'EBITDA': 'ebitda',
-                              'Name': 'longName'} # Added 'Name' to map to 'longName'
-        investiny_overview_data_fetched = False
-        investiny_overview_data_dict = None
-        asset_id = get_investiny_asset_id(ticker_symbol)
-        if asset_id:
-            for inv_key, yf_key in investiny_info_map.items():
-                if data["info"].get(yf_key) is None:
-                    if not investiny_overview_data_fetched:
-                        try:
-                            investiny_overview_data_dict = investiny_overview(asset_id=asset_id)
-                            investiny_overview_data_fetched = True
-                        except Exception as e_inv_ov:
-                            pass; break
-                    if investiny_overview_data_dict and investiny_overview_data_dict.get(inv_key):
-                        raw_val = investiny_overview_data_dict.get(inv_key)
-                        if yf_key == 'dividendYield' and isinstance(raw_val, str) and '(' in raw_val and '%' in raw_val:
-                            try: yield_str = raw_val.split('(')[1].split('%')[0]; converted_val = convert_financial_string_to_float(yield_str + '%')
-                            except: converted_val = None
-                        else: converted_val = convert_financial_string_to_float(raw_val)
-                        if converted_val is not None: data["info"][yf_key] = converted_val
-            if not data["info"].get('symbol') and investiny_overview_data_dict:
-                data["info"]['symbol'] = ticker_symbol
-                data["info"]['longName'] = investiny_overview_data_dict.get('name', ticker_symbol)
+    investiny_overview_data_dict = provider_results.get("investiny")
+    investiny_missing = _missing_info_fields(data["info"], INVESTINY_INFO_FIELDS) if investiny_overview_data_dict else []
+    if investiny_missing:
+        for inv_key, yf_key in investiny_missing:
+            raw_val = investiny_overview_data_dict.get(inv_key)
+            if raw_val:
+                if yf_key == 'dividendYield' and isinstance(raw_val, str) and '(' in raw_val and '%' in raw_val:
+                    try: yield_str = raw_val.split('(')[1].split('%')[0]; converted_val = convert_financial_string_to_float(yield_str + '%')
+                    except: converted_val = None
+                else: converted_val = convert_financial_string_to_float(raw_val)
+                if converted_val is not None: data["info"][yf_key] = converted_val
+        if not data["info"].get('symbol'):
+            data["info"]['symbol'] = ticker_symbol
+            data["info"]['longName'] = investiny_overview_data_dict.get('name', ticker_symbol)
 
     # 5. Fallback to finvizfinance for missing info fields
-    if finviz_available:
-        finviz_map = {'P/E': 'trailingPE', 'EPS (ttm)': 'trailingEps', 'Market Cap': 'marketCap', 'Dividend %': 'dividendYield',
-                      'P/S': 'priceToSalesTrailing12Months', 'Insider Own': 'heldPercentInsiders', 'Inst Own': 'heldPercentInstitutions'}
-        finviz_data = None
-        try:
-            stock_finviz = FinvizStock(ticker_symbol)
-            finviz_data = stock_finviz.get_stock()
-        except Exception as e_finviz:
-            pass
-        if finviz_data:
-            
-            for fv_key, yf_key in finviz_map.items():
-                if data["info"].get(yf_key) is None and fv_key in finviz_data:
-                    converted_val = convert_financial_string_to_float(finviz_data[fv_key])
-                    if converted_val is not None: data["info"][yf_key] = converted_val
-            if not data["info"].get('sector') and 'Sector' in finviz_data: data["info"]['sector'] = finviz_data['Sector']
-            if not data["info"].get('industry') and 'Industry' in finviz_data: data["info"]['industry'] = finviz_data['Industry']
+    finviz_data = provider_results.get("finviz")
+    if finviz_data:
+        for fv_key, yf_key in _missing_info_fields(data["info"], FINVIZ_INFO_FIELDS):
+            if fv_key in finviz_data:
+                converted_val = convert_financial_string_to_float(finviz_data[fv_key])
+                if converted_val is not None: data["info"][yf_key] = converted_val
+        if not data["info"].get('sector') and 'Sector' in finviz_data: data["info"]['sector'] = finviz_data['Sector']
+        if not data["info"].get('industry') and 'Industry' in finviz_data: data["info"]['industry'] = finviz_data['Industry']
 
     # Set final data source
     if len(data_sources_used) == 0:
@@ -268,8 +500,39 @@ def _fetch_stock_data_cached(ticker_symbol: str, _timestamp: int) -> Dict[str, A
     else:
         data["data_source"] = "mixed (" + ", ".join(data_sources_used) + ")"
 
+    for key in STOCK_DATA_TABLE_KEYS:
+        if data[key] is None: data[key] = _empty_table(key)
     return data
 
+# In-flight fetches keyed like the cache, so concurrent misses for the same ticker share one upstream cascade
+_inflight_fetches: Dict[Tuple[str, int], Future] = {}
+_inflight_lock = threading.Lock()
+
+def _fetch_stock_data_coalesced(ticker_symbol: str, timestamp: int) -> Dict[str, Any]:
+    # lru_cache does not stop concurrent callers from all computing the same missing entry,
+    # so the first caller for a key runs the fetch and the others wait on its Future.
+    # Tickers that just failed the whole cascade short-circuit to an empty payload.
+    if _is_known_invalid_ticker(ticker_symbol): return _empty_stock_data()
+    key = (ticker_symbol, timestamp)
+    with _inflight_lock:
+        future = _inflight_fetches.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight_fetches[key] = future
+    if not is_owner:
+        return future.result()
+    try:
+        result = _fetch_stock_data_cached(ticker_symbol, timestamp)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight_fetches.pop(key, None)
+
 def fetch_stock_data(ticker_symbol: str, source: Optional[str] = None) -> Dict[str, Any]:
     """
     Fetch stock data for a given ticker.
@@ -290,20 +553,61 @@ def fetch_stock_data(ticker_symbol: str, source: Optional[str] = None) -> Dict[s
             if fmp_data and fmp_data.get("info", {}).get("symbol"):
                 return fmp_data
         # If FMP fails or is unavailable, return empty data structure
-        return {
-            "info": {},
-            "financials": pd.DataFrame(),
-            "balance_sheet": pd.DataFrame(),
-            "cash_flow": pd.DataFrame(),
-            "major_holders": pd.DataFrame(),
-            "dividends": pd.Series(dtype=float),
-            "actions": pd.DataFrame(),
-            "history": pd.DataFrame(),
-            "data_source": "financial_modeling_prep (failed)"
-        }
+        return _empty_stock_data("financial_modeling_prep (failed)")
     
     # Default: Use yfinance with all fallbacks
-    now = datetime.now()
-    # Use integer division to get the number of full cache intervals since epoch
-    timestamp = int(now.timestamp() // CACHE_TTL_SECONDS) * CACHE_TTL_SECONDS
-    return _fetch_stock_data_cached(ticker_symbol, timestamp)
+    return _fetch_stock_data_coalesced(ticker_symbol, _cache_timestamp())
+
+async def fetch_stock_data_async(ticker_symbol: str, source: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Async variant of fetch_stock_data for use in request handlers.
+    
+    Runs the blocking fetch on the shared fetch thread pool so the event
+    loop keeps serving other requests while the providers are queried.
+    Cache hits go through the same lru/Redis layers as fetch_stock_data.
+    
+    Args:
+        ticker_symbol: The stock ticker symbol
+        source: Optional data source preference, as for fetch_stock_data
+    
+    Returns:
+        Dictionary containing stock data
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_fetch_executor, fetch_stock_data, ticker_symbol, source)
+
+async def fetch_stock_data_batch(ticker_symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch stock data for several tickers concurrently.
+    
+    Shared-cache hits are read with a single Redis MGET. The remaining tickers
+    run the same cached yfinance-plus-fallbacks cascade as fetch_stock_data,
+    on a shared thread pool, so wall time is bounded by the slowest ticker
+    rather than the sum of all of them.
+    
+    Args:
+        ticker_symbols: The stock ticker symbols (duplicates are fetched once)
+    
+    Returns:
+        Dictionary mapping each ticker to its stock data; tickers whose fetch
+        raised get an empty data structure
+    """
+    unique_tickers = list(dict.fromkeys(ticker_symbols))
+    # One cache bucket for the whole batch so every ticker shares the same snapshot window
+    timestamp = _cache_timestamp()
+    loop = asyncio.get_running_loop()
+    # Resolve shared-cache hits for the whole batch in one round trip before going upstream
+    cached = await loop.run_in_executor(
+        _fetch_executor, _shared_cache_get_many, [_shared_cache_key(ticker, timestamp) for ticker in unique_tickers]
+    )
+    stock_data: Dict[str, Dict[str, Any]] = {
+        ticker: data for ticker, data in zip(unique_tickers, cached) if data is not None
+    }
+    missing = [ticker for ticker in unique_tickers if ticker not in stock_data]
+    results = await asyncio.gather(
+        *(loop.run_in_executor(_fetch_executor, _fetch_stock_data_coalesced, ticker, timestamp) for ticker in missing),
+        return_exceptions=True,
+    )
+    for ticker, result in zip(missing, results):
+        stock_data[ticker] = result if not isinstance(result, BaseException) else _empty_stock_data()
+    return {ticker: stock_data[ticker] for ticker in unique_tickers}
@@ -1,12 +1,15 @@
 import asyncio
 import os
-from functools import lru_cache
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from datetime import datetime
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from uuid import UUID
 import logging
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -15,67 +18,185 @@ from langchain_core.tools import BaseTool
 from app.financial_agent.llm import ChatOpenRouter
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from app.financial_agent.mcp_config.config import load_mcp_config
+from app.financial_agent.mcp_config.session_pool import MCPSessionPool
 from langchain_core.utils.function_calling import convert_to_openai_tool
 from app.financial_agent.tools.registry import create_financial_tools_registry
+from app.financial_agent.graph import create_agent_graph
+from app.database import get_db
 
 logger = logging.getLogger(__name__)
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
+# Authenticated users by id, so repeated requests skip the user SELECT.
+# Tokens are still decoded (and expiry checked) on every request. Changes made to a
+# user outside invalidate_cached_user() (e.g. a deactivation) show up once the entry
+# expires; set USER_CACHE_TTL_SECONDS=0 to disable the cache.
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAXSIZE = 10_000
+_user_cache: "OrderedDict[UUID, tuple]" = OrderedDict()
 
-class AgentDependencies(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedUser:
+    """
+    Read-only snapshot of the authenticated user's columns.
+
+    Not bound to any database session, so it can be cached and shared across
+    requests; a rollback in one request cannot expire it under another.
+    """
+    id: UUID
+    email: str
+    name: Optional[str]
+    is_active: bool
+    is_guest: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+def _get_cached_user(user_id: UUID):
+    entry = _user_cache.get(user_id)
+    if entry is None:
+        return None
+    user, cached_at = entry
+    if time.monotonic() - cached_at >= USER_CACHE_TTL_SECONDS:
+        _user_cache.pop(user_id, None)
+        return None
+    _user_cache.move_to_end(user_id)
+    return user
+
+
+def _cache_user(user_id: UUID, user: AuthenticatedUser) -> None:
+    if USER_CACHE_TTL_SECONDS <= 0:
+        return
+    _user_cache[user_id] = (user, time.monotonic())
+    _user_cache.move_to_end(user_id)
+    if len(_user_cache) > USER_CACHE_MAXSIZE:
+        _user_cache.popitem(last=False)
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """Drop a user from the authentication cache, e.g. on logout or account changes."""
+    _user_cache.pop(user_id, None)
+
+
+# Search tool names exposed by the Tavily MCP server across its versions, in order of preference
+TAVILY_TOOL_NAMES = ("tavily-search", "tavily_search", "tavily_search_results_json")
+
+# OpenAI schemas keyed by tool identity; the tool is kept alongside its schema so its id is never reused
+_openai_tool_schemas: Dict[int, Tuple[BaseTool, Mapping[str, Any]]] = {}
+
+
+def _openai_tool_schema(tool: BaseTool) -> Mapping[str, Any]:
+    """Return the read-only OpenAI function schema of a tool, converting it only the first time it is seen."""
+    cached = _openai_tool_schemas.get(id(tool))
+    if cached is None:
+        cached = (tool, MappingProxyType(convert_to_openai_tool(tool)))
+        _openai_tool_schemas[id(tool)] = cached
+    return cached[1]
+
+
+# Financial tool registries keyed by (tavily tool, llm) identity. The key objects are held in the
+# entry so their ids stay unique; only the last few combinations are kept.
+FINANCIAL_REGISTRY_CACHE_MAXSIZE = 4
+_financial_registries: "OrderedDict[Tuple[int, int], tuple]" = OrderedDict()
+
+
+def _financial_tools_registry_for(tavily_tool: Optional[BaseTool], llm: ChatOpenRouter):
+    """Return the financial tools registry for these dependencies, building it only once per pair."""
+    key = (id(tavily_tool), id(llm))
+    entry = _financial_registries.get(key)
+    if entry is None:
+        entry = (tavily_tool, llm, create_financial_tools_registry(tavily_tool=tavily_tool, llm=llm))
+        _financial_registries[key] = entry
+        if len(_financial_registries) > FINANCIAL_REGISTRY_CACHE_MAXSIZE:
+            _financial_registries.popitem(last=False)
+    return entry[2]
+
+
+@dataclass(frozen=True, slots=True)
+class AgentDependencies:
     """A container for the dependencies required by the agent."""
     llm: ChatOpenRouter
-    tools_for_llm: List[Dict[str, Any]]
+    tools_for_llm: Tuple[Mapping[str, Any], ...]
     tools_map: Dict[str, BaseTool]
+    # Agent graph compiled with the fields above bound to its nodes
+    graph: Any
 
-@lru_cache(maxsize=1)
-def get_agent_dependencies() -> AgentDependencies:
+async def create_mcp_session_pool() -> MCPSessionPool:
     """
-    Initializes and returns the dependencies required for the financial agent.
+    Opens a persistent session to every configured MCP server.
 
-    This function is cached to ensure that the expensive initialization of the LLM,
-    tools, and MCP client only happens once.
+    Must be called from the application lifespan, which is also responsible for
+    calling close_all() on shutdown.
 
     Returns:
-        An AgentDependencies object containing the initialized LLM and tools.
+        An MCPSessionPool with one connected session per server.
     """
-    logger.info("Initializing agent dependencies...")
-    
-    # Initialize the language model
-    llm = ChatOpenRouter(
+    # Load MCP server configurations and set up the client
+    server_configs = await asyncio.to_thread(load_mcp_config)
+    # Normalized copies, so the loaded config itself is never mutated
+    client_config = {
+        name: {**config, "transport": config.get("transport", "stdio")}
+        for name, config in server_configs["mcpServers"].items()
+    }
+
+    mcp_pool = MCPSessionPool(MultiServerMCPClient(client_config))
+    try:
+        # Sessions are entered one by one: they must be opened and closed in the lifespan task
+        for server_name in client_config:
+            await mcp_pool.connect(server_name)
+    except Exception:
+        await mcp_pool.close_all()
+        raise
+    logger.info(f"Connected to {len(client_config)} MCP servers")
+    return mcp_pool
+
+
+async def create_llm() -> ChatOpenRouter:
+    """
+    Builds the agent's language model in a worker thread.
+
+    Construction is synchronous, so running it off the event loop lets the
+    lifespan open the MCP sessions at the same time.
+    """
+    llm = await asyncio.to_thread(
+        ChatOpenRouter,
         model_name=os.environ.get("OPENROUTER_MODEL", "google/gemini-flash-1.5:free"),
     )
     logger.info(f"Initialized LLM: {llm.model_name}")
+    return llm
 
-    # Load MCP server configurations and set up the client
-    server_configs = load_mcp_config()
-    client_config = server_configs["mcpServers"]
-    for server_name, config in client_config.items():
-        if "transport" not in config:
-            config["transport"] = "stdio"
 
-    tool_executor = MultiServerMCPClient(client_config)
+async def init_agent_dependencies(mcp_pool: MCPSessionPool, llm: ChatOpenRouter) -> AgentDependencies:
+    """
+    Initializes the dependencies required for the financial agent.
+
+    Called once from the application lifespan so the expensive initialization of
+    the LLM, tools, and MCP client runs on the server's event loop at startup.
 
-    # Asynchronously get external tools (like Tavily)
-    async def get_external_tools_async():
-        return await tool_executor.get_tools()
+    Args:
+        mcp_pool: Open MCP sessions the external tools are bound to
+        llm: The language model from create_llm()
 
-    # Run the async function to get external tools
-    external_tools = asyncio.run(get_external_tools_async())
+    Returns:
+        An AgentDependencies object containing the initialized LLM and tools.
+    """
+    logger.info("Initializing agent dependencies...")
+
+    # Get external tools (like Tavily) from the pooled sessions, loading each server concurrently
+    external_tools = await mcp_pool.get_tools()
     logger.info(f"Loaded {len(external_tools)} external tools")
     
     # Find Tavily tool for financial tools integration
-    tavily_tool = None
-    for tool in external_tools:
-        if 'tavily' in tool.name.lower() or 'search' in tool.name.lower():
-            tavily_tool = tool
-            logger.info(f"Found Tavily tool: {tool.name}")
-            break
+    tools_by_name = {tool.name: tool for tool in external_tools}
+    tavily_tool = next((tools_by_name[name] for name in TAVILY_TOOL_NAMES if name in tools_by_name), None)
+    if tavily_tool is not None:
+        logger.info(f"Found Tavily tool: {tavily_tool.name}")
     
     # Initialize financial analysis tools with Tavily integration
-    financial_tools_registry = create_financial_tools_registry(tavily_tool=tavily_tool, llm=llm)
+    financial_tools_registry = _financial_tools_registry_for(tavily_tool, llm)
     financial_tools = financial_tools_registry.get_all_tools()
     logger.info(f"Initialized {len(financial_tools)} financial analysis tools")
     
@@ -83,13 +204,18 @@ def get_agent_dependencies() -> AgentDependencies:
     all_tools = external_tools + financial_tools
     logger.info(f"Total tools available: {len(all_tools)}")
     
-    # Log all available tools
-    for tool in all_tools:
-        logger.info(f"  - {tool.name}: {tool.description[:100]}...")
+    # Log all available tools (debug only, so default runs skip the formatting)
+    if logger.isEnabledFor(logging.DEBUG):
+        for tool in all_tools:
+            logger.debug("  - %s: %.100s...", tool.name, tool.description)
 
     # Prepare tools for the LLM and create a map for execution
-    tools_for_llm = [convert_to_openai_tool(tool) for tool in all_tools]
-    tools_map = {tool.name: tool for tool in all_tools}
+    tools_for_llm = tuple(_openai_tool_schema(tool) for tool in all_tools)
+    tools_map: Dict[str, BaseTool] = {}
+    for tool in all_tools:
+        # Fail at startup rather than letting one tool silently shadow another
+        if tools_map.setdefault(tool.name, tool) is not tool:
+            raise RuntimeError(f"Duplicate tool name {tool.name!r}")
 
     logger.info("Agent dependencies initialization completed")
     
@@ -97,63 +223,100 @@ def get_agent_dependencies() -> AgentDependencies:
         llm=llm,
         tools_for_llm=tools_for_llm,
         tools_map=tools_map,
+        graph=create_agent_graph(llm, tools_for_llm, tools_map),
     )
 
 
-async def get_current_user(
-    token: Optional[str] = Depends(oauth2_scheme),
-):
+async def get_agent_dependencies(request: Request) -> AgentDependencies:
     """
-    Dependency to get the current authenticated user from the JWT token.
+    Dependency that returns the agent dependencies initialized at startup.
+
+    Declared async because it only reads app state; FastAPI would otherwise
+    dispatch it to the threadpool on every request.
+
+    Raises:
+        HTTPException: If initialization failed during startup
+    """
+    agent_deps = getattr(request.app.state, "agent_deps", None)
+    if agent_deps is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Financial agent is not available",
+        )
+    return agent_deps
+
+
+async def _resolve_user(token: Optional[str], db: AsyncSession):
+    """
+    Resolves the user a JWT access token belongs to, without raising.
     
     Args:
-        token: The JWT access token from the Authorization header
+        token: The JWT access token, or None if the request has none
+        db: The request's database session
         
     Returns:
-        The authenticated User object
-        
-    Raises:
-        HTTPException: If the token is invalid or the user is not found
+        A (user, error) pair: the AuthenticatedUser and None on success, or None
+        and the reason the token was rejected
     """
-    from app.database import get_db, AsyncSessionLocal
     from app.auth.jwt import decode_token
     from app.models.user import User
     
     if token is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        return None, "Not authenticated"
     
     # Decode the token
     token_data = decode_token(token)
     
-    if token_data is None or token_data.user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    if token_data is None:
+        return None, "Could not validate credentials"
     
     if token_data.token_type != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token type",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        return None, "Invalid token type"
     
-    # Get user from database
-    async with AsyncSessionLocal() as db:
-        result = await db.execute(
-            select(User).where(User.id == UUID(token_data.user_id))
-        )
-        user = result.scalar_one_or_none()
+    user = _get_cached_user(token_data.user_id)
+    if user is not None:
+        return user, None
+    
+    # Get the user's columns from the database. Selecting columns rather than the entity
+    # keeps the User out of the request session shared with the endpoint (so its commit
+    # or rollback cannot touch it) and skips loading the user's relationships.
+    result = await db.execute(
+        select(*(getattr(User, field.name) for field in fields(AuthenticatedUser)))
+        .where(User.id == token_data.user_id)
+    )
+    row = result.one_or_none()
+    
+    if row is None:
+        return None, "User not found"
+    
+    user = AuthenticatedUser(*row)
+    _cache_user(token_data.user_id, user)
+    return user, None
+
+
+async def get_current_user(
+    token: Optional[str] = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Dependency to get the current authenticated user from the JWT token.
+    
+    Args:
+        token: The JWT access token from the Authorization header
+        db: The request's database session, shared with the endpoint
+        
+    Returns:
+        The AuthenticatedUser snapshot of the user
+        
+    Raises:
+        HTTPException: If the token is invalid or the user is not found
+    """
+    user, error = await _resolve_user(token, db)
     
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            detail=error,
             headers={"WWW-Authenticate": "Bearer"},
         )
     
@@ -170,7 +333,7 @@ async def get_current_active_user(
         current_user: The authenticated user from get_current_user
         
     Returns:
-        The active User object
+        The active AuthenticatedUser
         
     Raises:
         HTTPException: If the user is inactive
@@ -185,17 +348,13 @@ async def get_current_active_user(
 
 async def get_optional_current_user(
     token: Optional[str] = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Dependency to optionally get the current user.
     Returns None if no token is provided or token is invalid.
     Useful for endpoints that work with or without authentication.
     """
-    if token is None:
-        return None
-    
-    try:
-        return await get_current_user(token)
-    except HTTPException:
-        return None
+    user, _ = await _resolve_user(token, db)
+    return user
 
@@ -2,6 +2,7 @@ import asyncio
 import logging
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from financial_agent.mcp_config.config import load_mcp_config
+from financial_agent.mcp_config.session_pool import MCPSessionPool
 from financial_agent.graph import create_agent_graph
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.utils.function_calling import convert_to_openai_tool
@@ -10,6 +11,11 @@ import os
 from dotenv import load_dotenv
 from .llm import ChatOpenRouter
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -17,30 +23,22 @@ load_dotenv()
 
 async def main():
     server_configs = load_mcp_config()
-    processes = []
+    client_config = {
+        name: {**config, "transport": config.get("transport", "stdio")}
+        for name, config in server_configs["mcpServers"].items()
+    }
+
+    # The stdio transport execs each server directly (no shell), and the MCP initialize
+    # handshake on connect is the readiness check
+    mcp_pool = MCPSessionPool(MultiServerMCPClient(client_config))
 
     try:
         logging.info("Starting MCP servers...")
-        for server_name, config in server_configs["mcpServers"].items():
-            env = os.environ.copy()
-            if "env" in config:
-                env.update(config["env"])
-
-            command_str = " ".join([config["command"]] + config["args"])
-            process = await asyncio.create_subprocess_shell(command_str, env=env)
-            processes.append(process)
-            logging.info(f"Started MCP server '{server_name}' with PID {process.pid}")
-
-        logging.info("Waiting for servers to initialize...")
-        await asyncio.sleep(5)
-
-        client_config = server_configs["mcpServers"]
-        for server_name, config in client_config.items():
-            if "transport" not in config:
-                config["transport"] = "stdio"
-
-        tool_executor = MultiServerMCPClient(client_config)
-        tools = await tool_executor.get_tools()
+        for server_name in client_config:
+            await mcp_pool.connect(server_name)
+            logging.info(f"MCP server '{server_name}' is ready")
+
+        tools = await mcp_pool.get_tools()
         logging.info(f"Available tools: {[tool.name for tool in tools]}")
 
         tools_for_llm = [convert_to_openai_tool(tool) for tool in tools]
@@ -50,7 +48,7 @@ async def main():
             model_name=os.environ.get("OPENROUTER_MODEL", "google/gemini-flash-1.5:free"),
         )
         
-        app = create_agent_graph()
+        app = create_agent_graph(llm, tools_for_llm, tools_map)
 
         logging.info("Agentic Chatbot is ready. Type 'exit' to end the conversation.")
         
@@ -72,20 +70,12 @@ async def main():
             conversation_history.append(HumanMessage(content=user_input))
             logging.info(f"Appended to history. New history length: {len(conversation_history)}")
 
-            config = {
-                "configurable": {
-                    "llm": llm,
-                    "tools": tools_for_llm,
-                    "tools_map": tools_map,
-                }
-            }
-            
             inputs = {"messages": conversation_history}
             logging.info(f"Streaming graph with inputs: {inputs}")
             
             final_state = None
             try:
-                final_state = await app.ainvoke(inputs, config=config)
+                final_state = await app.ainvoke(inputs)
                 logging.info(f"---GRAPH FINAL STATE: {final_state}---")
             except Exception as e:
                 logging.error(f"---ERROR DURING GRAPH INVOCATION: {e}---", exc_info=True)
@@ -106,18 +96,16 @@ async def main():
 
     finally:
         logging.info("Terminating all MCP servers...")
-        for process in processes:
-            try:
-                process.terminate()
-                await process.wait()
-                logging.info(f"Terminated MCP server with PID {process.pid}")
-            except ProcessLookupError:
-                logging.warning(f"Process with PID {process.pid} already terminated.")
+        await mcp_pool.close_all()
         logging.info("All MCP servers have been shut down.")
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # uvloop's event loop when available, the stdlib one otherwise
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logging.info("Keyboard interrupt received. Exiting.")
\ No newline at end of file
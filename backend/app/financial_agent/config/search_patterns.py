@@ -10,6 +10,32 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _specificity_bonus(pattern: str) -> int:
+    """Extra extraction confidence for patterns that require an explicit metric label."""
+    return 20 if 'ROIC:' in pattern or 'ROE:' in pattern else 0
+
+
+_LEADING_LITERAL = re.compile(r'[A-Za-z0-9/& ]+')
+
+# Characters re.IGNORECASE matches to an ASCII letter although lower() does not map them to it
+# (dotted/dotless i and long s); U+0130 also changes length when lowercased
+_CASE_FOLD_EXCEPTIONS = re.compile('[\u0130\u0131\u017f]')
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Lowercased literal text every match of the pattern starts with, or '' if there is none."""
+    if '|' in pattern:
+        return ''
+    literal = _LEADING_LITERAL.match(pattern)
+    if literal is None:
+        return ''
+    prefix = literal.group()
+    # A quantifier makes the last literal character optional
+    if pattern[literal.end():literal.end() + 1] in ('?', '*', '+', '{'):
+        prefix = prefix[:-1]
+    return prefix.lower()
+
+
 class FinancialDataPatterns:
     """Pattern matching for extracting financial data from web content."""
     
@@ -157,6 +183,15 @@ class FinancialDataPatterns:
         ],
     }
     
+    # PATTERNS compiled once at import, each with its specificity bonus and literal prefix
+    COMPILED_PATTERNS = {
+        metric: [
+            (re.compile(pattern, re.IGNORECASE), _specificity_bonus(pattern), _literal_prefix(pattern))
+            for pattern in patterns
+        ]
+        for metric, patterns in PATTERNS.items()
+    }
+    
     # Multipliers for financial shorthand notation
     MULTIPLIERS = {
         'K': 1000,
@@ -165,6 +200,23 @@ class FinancialDataPatterns:
         'T': 1000000000000,
     }
     
+    # Characters on each side of a match searched for context indicators
+    CONTEXT_WINDOW = 100
+    
+    # Context indicators that a value is reported (positive) or forward-looking (negative)
+    POSITIVE_CONTEXT_INDICATORS = [
+        'financial', 'earnings', 'annual report', 'sec filing',
+        'income statement', 'balance sheet', 'cash flow',
+        'investor relations', 'quarterly', 'fiscal year'
+    ]
+    NEGATIVE_CONTEXT_INDICATORS = [
+        'target', 'estimate', 'projected', 'expected',
+        'forecast', 'guidance', 'outlook', 'consensus'
+    ]
+    # Searched in lowercased content: much faster than re.IGNORECASE on short windows
+    POSITIVE_CONTEXT_RE = re.compile('|'.join(map(re.escape, POSITIVE_CONTEXT_INDICATORS)))
+    NEGATIVE_CONTEXT_RE = re.compile('|'.join(map(re.escape, NEGATIVE_CONTEXT_INDICATORS)))
+    
     def extract_metric(self, content: str, metric_type: str) -> List[Tuple[float, str, int]]:
         """
         Extract financial metrics from text content using regex patterns.
@@ -172,28 +224,100 @@ class FinancialDataPatterns:
         Returns:
             List of tuples: (normalized_value, raw_match, confidence_score)
         """
-        patterns = self.PATTERNS.get(metric_type, [])
-        matches = []
+        patterns = self.COMPILED_PATTERNS.get(metric_type, [])
         
         if not patterns:
             logger.warning(f"No patterns defined for metric type: {metric_type}")
-            return matches
+            return []
+        
+        return self._match_patterns(content, patterns, self._lowercase_for_prefilter(content), {})
+    
+    def extract_all_metrics(self, content: str) -> Dict[str, List[Tuple[float, str, int]]]:
+        """
+        Extract every known metric from the same text content.
+        
+        The content is lowercased once and each literal prefix is searched for once,
+        however many metrics share it.
+        
+        Returns:
+            Dict mapping each metric type with at least one match to its extract_metric result
+        """
+        lowered = self._lowercase_for_prefilter(content)
+        prefix_positions: Dict[str, int] = {}
+        results = {}
+        for metric_type, patterns in self.COMPILED_PATTERNS.items():
+            matches = self._match_patterns(content, patterns, lowered, prefix_positions)
+            if matches:
+                results[metric_type] = matches
+        return results
+    
+    @staticmethod
+    def _lowercase_for_prefilter(content: str) -> Optional[str]:
+        """
+        Lowercased content for the literal prefix and context checks, or None if its
+        offsets may not match the original (every pattern then scans the content).
+        
+        lower() agrees with re.IGNORECASE (and keeps offsets) for every character except
+        the few in _CASE_FOLD_EXCEPTIONS, so only content containing one of those skips
+        the prefilter. Web pages with curly quotes, dashes or accents still use it.
+        """
+        if content.isascii() or _CASE_FOLD_EXCEPTIONS.search(content) is None:
+            return content.lower()
+        return None
+    
+    @staticmethod
+    def _find_matches(pattern: re.Pattern, prefix: str, content: str, lowered: Optional[str], start: int):
+        """
+        Yield the same matches as pattern.finditer(content, start).
+        
+        Every match begins with the pattern's literal prefix, so with lowercased content the
+        regex is only tried at the offsets str.find locates for the prefix (start is the first
+        one) instead of at every position of the content.
+        """
+        if lowered is None or not prefix:
+            yield from pattern.finditer(content, start)
+            return
         
-        for pattern in patterns:
-            try:
-                found = re.findall(pattern, content, re.IGNORECASE)
-                for match in found:
-                    normalized_value = self._normalize_financial_value(match)
-                    if normalized_value is not None:
-                        # Calculate confidence based on pattern specificity and context
-                        confidence = self._calculate_extraction_confidence(pattern, match, content)
-                        matches.append((normalized_value, match, confidence))
-            except re.error as e:
-                logger.error(f"Regex error with pattern '{pattern}': {e}")
+        position = start
+        while position != -1:
+            found = pattern.match(content, position)
+            if found is not None:
+                yield found
+                position = lowered.find(prefix, found.end())
+            else:
+                position = lowered.find(prefix, position + 1)
+    
+    def _match_patterns(self, content: str, patterns: List[Tuple[re.Pattern, int, str]],
+                        lowered: Optional[str], prefix_positions: Dict[str, int]) -> List[Tuple[float, str, int]]:
+        """Collect the matches of one metric's compiled patterns, sorted by confidence."""
+        # Best (normalized_value, raw_match, confidence) per raw match; overlapping
+        # patterns often capture the same value with different confidence
+        best_matches: Dict[str, Tuple[float, str, int]] = {}
+        
+        # A pattern can only match where its literal prefix occurs, so a substring search
+        # on the lowercased content replaces the regex scan when the prefix is absent
+        for pattern, specificity_bonus, prefix in patterns:
+            start = 0
+            if lowered is not None and prefix:
+                start = prefix_positions.get(prefix)
+                if start is None:
+                    start = prefix_positions[prefix] = lowered.find(prefix)
+                if start == -1:
+                    continue
+            for found in self._find_matches(pattern, prefix, content, lowered, start):
+                match = found.group(1)
+                normalized_value = self._normalize_financial_value(match)
+                if normalized_value is not None:
+                    # Calculate confidence based on pattern specificity and the value's own context
+                    confidence = self._calculate_extraction_confidence(
+                        specificity_bonus, found.start(1), found.end(1), content, lowered
+                    )
+                    best = best_matches.get(match)
+                    if best is None or confidence > best[2]:
+                        best_matches[match] = (normalized_value, match, confidence)
         
-        # Sort by confidence and remove duplicates
-        matches = sorted(set(matches), key=lambda x: x[2], reverse=True)
-        return matches
+        # Sort by confidence
+        return sorted(best_matches.values(), key=lambda x: x[2], reverse=True)
     
     def _normalize_financial_value(self, value_str: Union[str, float]) -> Optional[float]:
         """Normalize financial value string to float."""
@@ -215,10 +339,11 @@ class FinancialDataPatterns:
             value_str = value_str[:-1]
         
         # Handle multiplier notation
-        multiplier = 1.0
-        if value_str and value_str[-1].upper() in self.MULTIPLIERS:
-            multiplier = self.MULTIPLIERS[value_str[-1].upper()]
+        multiplier = self.MULTIPLIERS.get(value_str[-1:].upper())
+        if multiplier is not None:
             value_str = value_str[:-1]
+        else:
+            multiplier = 1.0
         
         try:
             numeric_val = float(value_str)
@@ -236,44 +361,27 @@ class FinancialDataPatterns:
             logger.debug(f"Could not convert to float: {value_str}")
             return None
     
-    def _calculate_extraction_confidence(self, pattern: str, match: str, content: str) -> int:
+    def _calculate_extraction_confidence(self, specificity_bonus: int, match_start: int, match_end: int,
+                                         content: str, lowered: Optional[str]) -> int:
         """Calculate confidence score for extracted value based on context."""
         confidence = 50  # Base confidence
         
         # Higher confidence for more specific patterns
-        if 'ROIC:' in pattern or 'ROE:' in pattern:
-            confidence += 20
+        confidence += specificity_bonus
         
         # Check for surrounding context that indicates financial data
-        context_window = 100
-        match_pos = content.find(match)
-        if match_pos != -1:
-            start = max(0, match_pos - context_window)
-            end = min(len(content), match_pos + len(match) + context_window)
-            context = content[start:end].lower()
-            
-            # Positive context indicators
-            positive_indicators = [
-                'financial', 'earnings', 'annual report', 'sec filing',
-                'income statement', 'balance sheet', 'cash flow',
-                'investor relations', 'quarterly', 'fiscal year'
-            ]
-            
-            for indicator in positive_indicators:
-                if indicator in context:
-                    confidence += 10
-                    break
-            
-            # Negative context indicators
-            negative_indicators = [
-                'target', 'estimate', 'projected', 'expected',
-                'forecast', 'guidance', 'outlook', 'consensus'
-            ]
-            
-            for indicator in negative_indicators:
-                if indicator in context:
-                    confidence -= 15
-                    break
+        start = max(0, match_start - self.CONTEXT_WINDOW)
+        end = min(len(content), match_end + self.CONTEXT_WINDOW)
+        if lowered is None:
+            # Offsets don't carry over to this content lowercased as a whole; lowercase just the window
+            lowered = content[start:end].lower()
+            start, end = 0, len(lowered)
+        
+        if self.POSITIVE_CONTEXT_RE.search(lowered, start, end):
+            confidence += 10
+        
+        if self.NEGATIVE_CONTEXT_RE.search(lowered, start, end):
+            confidence -= 15
         
         return min(100, max(10, confidence))  # Clamp between 10-100
 
@@ -362,21 +470,59 @@ class SearchQueryGenerator:
         }
     }
     
+    # Search priority of each field within a strategy (1-10, higher is more important)
+    SEARCH_PRIORITIES = {
+        'phil_town': {
+            'roic': 10,
+            'eps_growth': 9,
+            'sales_growth': 8,
+            'margin_of_safety': 8,
+            'debt_payoff': 7,
+            'insider_ownership': 6,
+            'fcf_growth': 7,
+            'bvps_growth': 6
+        },
+        'high_growth': {
+            'sales_growth': 10,
+            'net_margin_trend': 9,
+            'roe': 8,
+            'roic': 8,
+            'debt_to_ebitda': 7,
+            'psr_ratio': 6,
+            'per_ratio': 6,
+            'dividend_yield': 5
+        }
+    }
+    
+    # The nested tables above keyed by (strategy, field) for single lookups
+    _FLAT_QUERY_TEMPLATES = {
+        (strategy, field): templates
+        for strategy, fields in QUERY_TEMPLATES.items()
+        for field, templates in fields.items()
+    }
+    _FLAT_SEARCH_PRIORITIES = {
+        (strategy, field): priority
+        for strategy, fields in SEARCH_PRIORITIES.items()
+        for field, priority in fields.items()
+    }
+    
     def generate_queries(self, ticker: str, field: str, strategy: str) -> List[str]:
         """Generate contextual search queries based on strategy and field."""
-        templates = self.QUERY_TEMPLATES.get(strategy, {}).get(field, [])
+        templates = self._FLAT_QUERY_TEMPLATES.get((strategy, field))
         
         if not templates:
             # Generate generic queries if no specific templates exist
             templates = self._generate_generic_queries(field)
         
-        queries = [template.format(ticker=ticker.upper()) for template in templates]
+        # Templates only ever contain {ticker}, so a plain replace does the job of format()
+        ticker_upper = ticker.upper()
+        queries = [template.replace('{ticker}', ticker_upper) for template in templates]
         
         # Add some generic fallback queries
         queries.extend([
-            f"{ticker.upper()} {field} financial data",
-            f"{ticker.upper()} annual report {field}",
-            f"{ticker.upper()} 10-K {field} SEC filing"
+            f"{ticker_upper} {field} financial data",
+            f"{ticker_upper} annual report {field}",
+            f"{ticker_upper} 10-K {field} SEC filing"
         ])
         
         return queries
@@ -393,27 +539,4 @@ class SearchQueryGenerator:
     
     def get_search_priority(self, field: str, strategy: str) -> int:
         """Get search priority for a field within a strategy (1-10, higher is more important)."""
-        priority_map = {
-            'phil_town': {
-                'roic': 10,
-                'eps_growth': 9,
-                'sales_growth': 8,
-                'margin_of_safety': 8,
-                'debt_payoff': 7,
-                'insider_ownership': 6,
-                'fcf_growth': 7,
-                'bvps_growth': 6
-            },
-            'high_growth': {
-                'sales_growth': 10,
-                'net_margin_trend': 9,
-                'roe': 8,
-                'roic': 8,
-                'debt_to_ebitda': 7,
-                'psr_ratio': 6,
-                'per_ratio': 6,
-                'dividend_yield': 5
-            }
-        }
-        
-        return priority_map.get(strategy, {}).get(field, 5)  # Default priority: 5
\ No newline at end of file
+        return self._FLAT_SEARCH_PRIORITIES.get((strategy, field), 5)  # Default priority: 5
@@ -3,6 +3,9 @@ Source credibility ranking and validation for financial data sources.
 """
 
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 from enum import Enum
@@ -10,6 +13,39 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_NUMBER_RE = re.compile(r'\d+(?:,\d{3})*(?:\.\d+)?')
+
+_STRUCTURED_DATA_PATTERNS = [
+    re.compile(r'\$\d+(?:,\d{3})*(?:\.\d+)?[BMK]?'),  # Currency with multipliers
+    re.compile(r'\d+\.\d+%'),  # Percentages
+    re.compile(r':\s*\$?\d+(?:,\d{3})*'),  # Labeled values
+    re.compile(r'\|\s*\d+'),  # Table-like formatting
+]
+
+# Only searched for, never extracted, so each pattern is cut down to the shortest text
+# that any match must contain: a label character before the separator and one digit.
+# The leading `[A-Za-z\s]+` of the full patterns backtracks over every run of words.
+_CLEAR_LABEL_PATTERNS = [
+    re.compile(r'[A-Za-z\s]:\s*\$?\d'),  # [A-Za-z\s]+:\s*\$?\d+
+    re.compile(r'[A-Za-z\s]\s\$?\d'),  # [A-Za-z\s]+\s+\$?\d+(?:,\d{3})*
+    re.compile(r'\w\s+Ratio:\s*\d'),  # \w+\s+Ratio:\s*\d+
+]
+
+# Distinct domains scored per class; search results keep coming from the same few sites
+DOMAIN_SCORE_CACHE_MAXSIZE = 1024
+
+# Distinct URLs whose domain is remembered; the same result URLs are scored for several metrics
+URL_DOMAIN_CACHE_MAXSIZE = 4096
+
+# (url, content) pairs whose credibility score each ranker remembers
+SCORE_CACHE_MAXSIZE = 256
+
+
+@lru_cache(maxsize=URL_DOMAIN_CACHE_MAXSIZE)
+def _domain_of(url: str) -> str:
+    """Lowercased network location of a URL."""
+    return urlparse(url).netloc.lower()
+
 
 class SourceCredibilityRanker:
     """Ranks the credibility of web sources for financial data."""
@@ -61,6 +97,11 @@ class SourceCredibilityRanker:
         'wikipedia.org': 60,  # Good for general info, not current data
     }
     
+    # Entries that can occur inside a URL netloc, in priority order (a netloc never contains '/')
+    PARTIAL_DOMAIN_RANKINGS = tuple(
+        (pattern, float(score)) for pattern, score in DOMAIN_RANKINGS.items() if '/' not in pattern
+    )
+    
     # Content quality indicators
     POSITIVE_INDICATORS = [
         'annual report', '10-k', '10-q', '8-k', 'sec filing',
@@ -75,6 +116,12 @@ class SourceCredibilityRanker:
         'advertisement', 'promotional', 'sponsored'
     ]
     
+    def __init__(self):
+        # Scores are a function of url and content only, so data_point is not part of the key
+        self._score_cache: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        # Batches are scored off the event loop thread while other callers may score inline
+        self._score_cache_lock = threading.Lock()
+    
     def score_source_credibility(self, url: str, content: str, data_point: str) -> float:
         """
         Score the credibility of a web source for financial data.
@@ -87,18 +134,27 @@ class SourceCredibilityRanker:
         Returns:
             Credibility score from 0.0 to 1.0
         """
+        key = (url, content)
+        with self._score_cache_lock:
+            cached = self._score_cache.get(key)
+            if cached is not None:
+                self._score_cache.move_to_end(key)
+                return cached
+        
         try:
-            parsed_url = urlparse(url)
-            domain = parsed_url.netloc.lower()
+            domain = _domain_of(url)
             
             # Start with domain-based credibility
             domain_score = self._get_domain_score(domain)
             
+            # Lowercased once for every keyword check below
+            content_lower = content.lower()
+            
             # Adjust based on content quality
-            content_score = self._analyze_content_quality(content, data_point)
+            content_score = self._analyze_content_quality(content, content_lower, data_point)
             
             # Check for recency indicators
-            recency_score = self._assess_data_recency(content)
+            recency_score = self._assess_data_recency(content, content_lower)
             
             # Check for data presentation quality
             presentation_score = self._assess_presentation_quality(content)
@@ -112,22 +168,46 @@ class SourceCredibilityRanker:
             )
             
             # Normalize to 0-1 range
-            return min(1.0, max(0.0, final_score / 100.0))
+            score = min(1.0, max(0.0, final_score / 100.0))
+            
+            with self._score_cache_lock:
+                self._score_cache[key] = score
+                if len(self._score_cache) > SCORE_CACHE_MAXSIZE:
+                    self._score_cache.popitem(last=False)
+            return score
             
         except Exception as e:
             logger.error(f"Error scoring source credibility for {url}: {e}")
             return 0.5  # Default middle score on error
     
-    def _get_domain_score(self, domain: str) -> float:
+    def score_sources_batch(self, items: List[Tuple[str, str, str]]) -> List[float]:
+        """
+        Score the credibility of several web sources in one call.
+        
+        The scoring is regex-bound and holds the GIL, so the batch runs sequentially; async
+        callers hand the whole batch to a worker thread to keep the event loop responsive.
+        Repeated (url, content) pairs are scored once through the score cache.
+        
+        Args:
+            items: (url, content, data_point) tuples, as passed to score_source_credibility
+            
+        Returns:
+            Credibility scores from 0.0 to 1.0, in the order of items
+        """
+        return [self.score_source_credibility(url, content, data_point) for url, content, data_point in items]
+    
+    @classmethod
+    @lru_cache(maxsize=DOMAIN_SCORE_CACHE_MAXSIZE)
+    def _get_domain_score(cls, domain: str) -> float:
         """Get credibility score based on domain."""
         # Direct match
-        if domain in self.DOMAIN_RANKINGS:
-            return float(self.DOMAIN_RANKINGS[domain])
+        if domain in cls.DOMAIN_RANKINGS:
+            return float(cls.DOMAIN_RANKINGS[domain])
         
         # Partial matches
-        for pattern, score in self.DOMAIN_RANKINGS.items():
+        for pattern, score in cls.PARTIAL_DOMAIN_RANKINGS:
             if pattern in domain:
-                return float(score)
+                return score
         
         # Check for common patterns
         if domain.endswith('.edu'):
@@ -141,19 +221,16 @@ class SourceCredibilityRanker:
         else:
             return 40.0  # Unknown domain
     
-    def _analyze_content_quality(self, content: str, data_point: str) -> float:
+    def _analyze_content_quality(self, content: str, content_lower: str, data_point: str) -> float:
         """Analyze content quality for financial data."""
-        content_lower = content.lower()
         score = 50.0  # Base score
         
-        # Check for positive indicators
-        positive_count = sum(1 for indicator in self.POSITIVE_INDICATORS 
-                           if indicator in content_lower)
+        # Check for positive indicators (the bonus is capped at 6 hits)
+        positive_count = self._count_indicators(self.POSITIVE_INDICATORS, content_lower, 6)
         score += min(30, positive_count * 5)
         
-        # Check for negative indicators
-        negative_count = sum(1 for indicator in self.NEGATIVE_INDICATORS 
-                           if indicator in content_lower)
+        # Check for negative indicators (the penalty is capped at 5 hits)
+        negative_count = self._count_indicators(self.NEGATIVE_INDICATORS, content_lower, 5)
         score -= min(25, negative_count * 5)
         
         # Check for structured data indicators
@@ -161,15 +238,25 @@ class SourceCredibilityRanker:
             score += 15
         
         # Check for multiple data points (suggests comprehensive source)
-        if self._has_multiple_metrics(content):
+        if self._has_multiple_metrics(content_lower):
             score += 10
         
         return max(0, min(100, score))
     
-    def _assess_data_recency(self, content: str) -> float:
+    @staticmethod
+    def _count_indicators(indicators: List[str], content_lower: str, limit: int) -> int:
+        """Count the indicators present in the content, stopping once limit is reached."""
+        count = 0
+        for indicator in indicators:
+            if indicator in content_lower:
+                count += 1
+                if count >= limit:
+                    break
+        return count
+    
+    def _assess_data_recency(self, content: str, content_lower: str) -> float:
         """Assess how recent the data appears to be."""
         score = 50.0  # Base score
-        content_lower = content.lower()
         
         # Look for recent year indicators
         import datetime
@@ -216,28 +303,20 @@ class SourceCredibilityRanker:
     
     def _has_structured_data(self, content: str) -> bool:
         """Check if content has structured financial data."""
-        patterns = [
-            r'\$\d+(?:,\d{3})*(?:\.\d+)?[BMK]?',  # Currency with multipliers
-            r'\d+\.\d+%',  # Percentages
-            r':\s*\$?\d+(?:,\d{3})*',  # Labeled values
-            r'\|\s*\d+',  # Table-like formatting
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, content):
+        for pattern in _STRUCTURED_DATA_PATTERNS:
+            if pattern.search(content):
                 return True
         return False
     
-    def _has_multiple_metrics(self, content: str) -> bool:
+    def _has_multiple_metrics(self, content_lower: str) -> bool:
         """Check if content contains multiple financial metrics."""
         metrics = [
             'roic', 'roe', 'eps', 'revenue', 'debt', 'margin',
             'cash flow', 'ebitda', 'p/e', 'p/s'
         ]
         
-        found_metrics = sum(1 for metric in metrics 
-                           if metric in content.lower())
-        return found_metrics >= 3
+        # Stop at the third metric found instead of testing the rest
+        return self._count_indicators(metrics, content_lower, 3) >= 3
     
     def _has_tables(self, content: str) -> bool:
         """Check if content appears to contain tabular data."""
@@ -250,33 +329,22 @@ class SourceCredibilityRanker:
     
     def _has_clear_labels(self, content: str) -> bool:
         """Check if financial data has clear labels."""
-        label_patterns = [
-            r'[A-Za-z\s]+:\s*\$?\d+',
-            r'[A-Za-z\s]+\s+\$?\d+(?:,\d{3})*',
-            r'\w+\s+Ratio:\s*\d+',
-        ]
-        
-        return any(re.search(pattern, content) for pattern in label_patterns)
+        return any(pattern.search(content) for pattern in _CLEAR_LABEL_PATTERNS)
     
     def _has_consistent_formatting(self, content: str) -> bool:
         """Check for consistent number formatting."""
-        # Look for consistent use of commas, decimals, currency symbols
-        comma_count = content.count(',')
-        dollar_count = content.count('$')
-        percent_count = content.count('%')
-        
-        # If we have multiple numbers, check for consistency
-        numbers = re.findall(r'\d+(?:,\d{3})*(?:\.\d+)?', content)
+        # If we have multiple numbers, check for consistent use of thousands separators
+        numbers = _NUMBER_RE.findall(content)
         if len(numbers) > 3:
             # Check if most numbers follow similar formatting
-            comma_numbers = [n for n in numbers if ',' in n]
-            return len(comma_numbers) >= len(numbers) * 0.7
+            comma_numbers = sum(1 for n in numbers if ',' in n)
+            return comma_numbers >= len(numbers) * 0.7
         
         return True  # Default to true for small amounts of data
     
     def get_source_type_from_url(self, url: str) -> str:
         """Determine the type of source from URL."""
-        domain = urlparse(url).netloc.lower()
+        domain = _domain_of(url)
         
         if 'sec.gov' in domain or 'edgar' in domain:
             return 'sec_filing'
@@ -1,81 +1,165 @@
 import os
-import json
 import logging
 import asyncio
+from collections.abc import Mapping
 from typing import TypedDict, Annotated, Sequence, Any
-from langchain_core.messages import BaseMessage, ToolMessage, AIMessage
+
+import orjson
+from langchain_core.messages import BaseMessage, ToolMessage, AIMessage, HumanMessage
 from langgraph.graph import StateGraph, END
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Dict keys that are not strings are stringified like json.dumps does; values orjson
+# cannot serialize natively (e.g. Decimal) fall back to str()
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+def _dump_json(value: Any) -> str:
+    """Serializes a value to an indented JSON string."""
+    return orjson.dumps(value, default=str, option=_JSON_OPTIONS).decode()
 
 def _format_tool_response(response: Any) -> str:
     """Formats the tool response into a JSON string for consistent processing."""
-    logging.info(f"Formatting tool response: {response}")
+    logger.info("Formatting tool response: %s", response)
     if isinstance(response, (dict, list)):
         # If it's already a dict or list, dump it to a JSON string.
-        formatted_str = json.dumps(response, indent=2)
-        logging.info(f"Formatted dict/list response: {formatted_str}")
+        formatted_str = _dump_json(response)
+        logger.info("Formatted dict/list response: %s", formatted_str)
         return formatted_str
     elif isinstance(response, str):
         try:
-            # If it's a string, try to parse it as JSON and re-serialize.
-            # This validates and standardizes the JSON format.
-            parsed_json = json.loads(response)
-            formatted_str = json.dumps(parsed_json, indent=2)
-            logging.info(f"Validated and formatted JSON string: {formatted_str}")
+            # If it's a string, try to parse it as JSON to validate it.
+            parsed_json = orjson.loads(response)
+            if isinstance(parsed_json, (dict, list)):
+                # Already a JSON document; re-indenting it only costs a full serialization.
+                logger.info("Validated JSON string: %s", response)
+                return response
+            formatted_str = _dump_json(parsed_json)
+            logger.info("Validated and formatted JSON string: %s", formatted_str)
             return formatted_str
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # If it's a string but not valid JSON (e.g., an error message),
             # wrap it in a JSON structure.
-            logging.warning(f"Response is a non-JSON string. Wrapping it: {response}")
-            formatted_str = json.dumps({"message": response}, indent=2)
+            logger.warning("Response is a non-JSON string. Wrapping it: %s", response)
+            formatted_str = _dump_json({"message": response})
             return formatted_str
     else:
         # For any other data type, convert to string and wrap in a JSON structure.
-        logging.warning(f"Response is of an unexpected type. Converting to string and wrapping: {type(response)}")
-        formatted_str = json.dumps({"value": str(response)}, indent=2)
+        logger.warning("Response is of an unexpected type. Converting to string and wrapping: %s", type(response))
+        formatted_str = _dump_json({"value": str(response)})
         return formatted_str
 
+def _format_tool_responses(responses: Sequence[Any]) -> list[str]:
+    """Formats a batch of tool responses, in order."""
+    return [_format_tool_response(response) for response in responses]
+
+# Longest tool description kept in the compact schemas sent while the agent works through tool calls
+TOOL_SUMMARY_DESCRIPTION_CHARS = 200
+
+def _compact_tool_schema(schema: Any) -> Any:
+    """Reduces an OpenAI tool schema to its name, a short description and bare argument schemas."""
+    function = schema.get("function") if isinstance(schema, Mapping) else None
+    if not isinstance(function, Mapping) or "name" not in function:
+        return schema
+    parameters = function.get("parameters") or {}
+    compact_parameters = {
+        "type": "object",
+        "properties": {
+            name: {key: value for key, value in prop.items() if key not in ("description", "title")}
+            for name, prop in (parameters.get("properties") or {}).items()
+        },
+    }
+    if "required" in parameters:
+        compact_parameters["required"] = parameters["required"]
+    return {
+        "type": "function",
+        "function": {
+            "name": function["name"],
+            "description": (function.get("description") or "")[:TOOL_SUMMARY_DESCRIPTION_CHARS],
+            "parameters": compact_parameters,
+        },
+    }
+
+def _tool_schema_entries(tools: Sequence[Any]) -> tuple:
+    """(lowercased name, full schema, compact schema) for each tool schema."""
+    entries = []
+    for schema in tools:
+        compact = _compact_tool_schema(schema)
+        name = compact["function"]["name"] if compact is not schema else None
+        entries.append((name.lower() if name else None, schema, compact))
+    return tuple(entries)
+
+def _select_tool_schemas(messages: Sequence[BaseMessage], entries: tuple) -> list:
+    """
+    Picks the tool schemas to send with the next LLM call.
+
+    A new user turn gets every full schema. While the agent works through tool calls,
+    only the tools it has already called in this turn keep their full schema; the rest
+    are sent compact, still callable but without the bulk of their documentation.
+    """
+    if not messages or isinstance(messages[-1], HumanMessage):
+        return [full for _, full, _ in entries]
+
+    called = set()
+    for msg in reversed(messages):
+        if isinstance(msg, HumanMessage):
+            break
+        if isinstance(msg, AIMessage):
+            called.update(call["name"].lower() for call in msg.tool_calls)
+
+    return [
+        full if name is None or name in called else compact
+        for name, full, compact in entries
+    ]
+
 # Define the state for our agent - it should only contain serializable data
 class AgentState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], lambda x, y: x + y]
 
-# The agent's thinking node, now accepting a config
-async def run_agent(state, config):
-    logging.info("---AGENT THINKING---")
-    logging.info(f"---CONFIG: {config}---")
-    llm = config["configurable"]["llm"]
-    tools = config["configurable"]["tools"]
+# The agent's thinking node; llm and tools bound by create_agent_graph can be overridden in config
+async def run_agent(state, config, llm=None, tools=None, tool_entries=()):
+    logger.info("---AGENT THINKING---")
+    logger.info("---CONFIG: %s---", config)
+    configurable = config.get("configurable", {})
+    llm = configurable.get("llm", llm)
+    if "tools" in configurable:
+        tools = configurable["tools"]
+        tool_entries = _tool_schema_entries(tools or ())
     messages = state["messages"]
+    if tool_entries:
+        tools = _select_tool_schemas(messages, tool_entries)
 
-    logging.info(f"---MESSAGES TO LLM (Count: {len(messages)})---")
-    for i, msg in enumerate(messages):
-        logging.info(f"  Message {i}: Type={type(msg).__name__}, Content='{msg.content}', Tool Calls={hasattr(msg, 'tool_calls') and msg.tool_calls}")
+    # Per-message logging walks the whole history, so skip it when INFO is disabled
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("---MESSAGES TO LLM (Count: %d)---", len(messages))
+        for i, msg in enumerate(messages):
+            logger.info("  Message %d: Type=%s, Content='%s', Tool Calls=%s",
+                        i, type(msg).__name__, msg.content, hasattr(msg, 'tool_calls') and msg.tool_calls)
 
-    logging.info(f"Invoking LLM: {llm.__class__.__name__}")
+    logger.info("Invoking LLM: %s", llm.__class__.__name__)
     try:
         response = await llm.ainvoke(messages, tools=tools)
-        logging.info(f"---AGENT RAW RESPONSE: {response}---")
+        logger.info("---AGENT RAW RESPONSE: %s---", response)
     except Exception as e:
-        logging.error(f"---ERROR DURING LLM INVOCATION: {e}---", exc_info=True)
+        logger.error("---ERROR DURING LLM INVOCATION: %s---", e, exc_info=True)
         error_message = f"An error occurred while communicating with the LLM: {e}"
         return {"messages": [AIMessage(content=error_message)]}
     
     return {"messages": [response]}
 
-# The tool execution node, now accepting a config
-async def execute_tools(state, config):
-    logging.info("---EXECUTING TOOLS---")
-    tools_map = config["configurable"]["tools_map"]
+# The tool execution node; a tools_map bound by create_agent_graph can be overridden in config
+async def execute_tools(state, config, tools_map=None):
+    logger.info("---EXECUTING TOOLS---")
+    tools_map = config.get("configurable", {}).get("tools_map", tools_map)
     last_message = state["messages"][-1]
     
     if not isinstance(last_message, AIMessage) or not last_message.tool_calls:
-        logging.warning("No tool calls found in the last message.")
+        logger.warning("No tool calls found in the last message.")
         return {"messages": []}
         
     tool_calls = last_message.tool_calls
-    logging.info(f"---CALLING TOOLS: {[call['name'] for call in tool_calls]}---")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("---CALLING TOOLS: %s---", [call['name'] for call in tool_calls])
     
     # Create a list of coroutines for each tool call
     coroutines = []
@@ -86,60 +170,74 @@ async def execute_tools(state, config):
             # Note: tool.ainvoke expects a dict of arguments
             coroutines.append(tool_to_call.ainvoke(call['args']))
         else:
-            logging.error(f"Tool '{tool_name}' not found in tools_map.")
+            logger.error("Tool '%s' not found in tools_map.", tool_name)
             # Append a placeholder for the response to maintain order
             coroutines.append(asyncio.sleep(0, result=f"Error: Tool '{tool_name}' not found."))
 
     try:
         # Execute all tool calls in parallel
         tool_responses = await asyncio.gather(*coroutines)
-        logging.info(f"---RAW TOOL RESPONSES: {tool_responses}---")
+        logger.info("---RAW TOOL RESPONSES: %s---", tool_responses)
     except Exception as e:
-        logging.error(f"---ERROR DURING TOOL EXECUTION: {e}---", exc_info=True)
+        logger.error("---ERROR DURING TOOL EXECUTION: %s---", e, exc_info=True)
         error_messages = [
             ToolMessage(content=f"Error executing tool {call['name']}: {e}", tool_call_id=call["id"])
             for call in tool_calls
         ]
         return {"messages": error_messages}
 
+    # Parsing and serializing large payloads is CPU work, so it runs off the event loop.
+    # One worker call for the batch: the formatting holds the GIL, so per-response
+    # threads would not run in parallel anyway.
+    formatted_contents = await asyncio.to_thread(_format_tool_responses, tool_responses)
+
     formatted_responses = []
-    for call, response in zip(tool_calls, tool_responses):
-        formatted_response = _format_tool_response(response)
-        logging.info(f"Formatted response for tool {call['name']}: {formatted_response}")
+    for call, formatted_response in zip(tool_calls, formatted_contents):
+        logger.info("Formatted response for tool %s: %s", call['name'], formatted_response)
         formatted_responses.append(
             ToolMessage(content=formatted_response, tool_call_id=call["id"])
         )
         
-    logging.info(f"---FINAL FORMATTED TOOL MESSAGES: {formatted_responses}---")
+    logger.info("---FINAL FORMATTED TOOL MESSAGES: %s---", formatted_responses)
     return {"messages": formatted_responses}
 
 # The conditional edge to decide the next step
 def should_continue(state):
-    logging.info("---CHECKING FOR TOOL CALLS---")
+    logger.info("---CHECKING FOR TOOL CALLS---")
     last_message = state["messages"][-1]
-    logging.info(f"Last message type: {type(last_message).__name__}")
+    logger.info("Last message type: %s", type(last_message).__name__)
     
     if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-        logging.info(f"Tool calls found: {last_message.tool_calls}")
-        logging.info("---DECISION: EXECUTE TOOLS---")
+        logger.info("Tool calls found: %s", last_message.tool_calls)
+        logger.info("---DECISION: EXECUTE TOOLS---")
         return "execute_tools"
     else:
-        logging.info("No tool calls found.")
-        logging.info("---DECISION: END---")
+        logger.info("No tool calls found.")
+        logger.info("---DECISION: END---")
         return END
 
-# Create the agent graph
-def create_agent_graph():
+# Create the agent graph. The LLM, its tool schemas and the tools map are bound to the
+# nodes once here, so callers only pass per-run settings (e.g. thread_id) in config.
+def create_agent_graph(llm=None, tools=None, tools_map=None):
     workflow = StateGraph(AgentState)
 
-    workflow.add_node("agent", run_agent)
-    workflow.add_node("execute_tools", execute_tools)
+    # Full and compact schemas are prepared once; run_agent picks between them each turn
+    tool_entries = _tool_schema_entries(tools or ())
+
+    async def agent(state, config):
+        return await run_agent(state, config, llm, tools, tool_entries)
+
+    async def call_tools(state, config):
+        return await execute_tools(state, config, tools_map)
+
+    workflow.add_node("agent", agent)
+    workflow.add_node("execute_tools", call_tools)
 
     workflow.set_entry_point("agent")
     workflow.add_conditional_edges("agent", should_continue)
     workflow.add_edge("execute_tools", "agent")
     
-    logging.info("Agent graph created successfully.")
+    logger.info("Agent graph created successfully.")
     return workflow.compile()
 
 graph = create_agent_graph()
\ No newline at end of file
@@ -1,14 +1,26 @@
 
 import os
-import json
 from pathlib import Path
 
+import orjson
+
+CONFIG_PATH = Path(__file__).parent / "mcp_config.json"
+
+# (mtime_ns, parsed config) of the last read; the file is only re-parsed when it changes
+_config_cache = None
+
 def load_mcp_config():
-    config_path = Path(__file__).parent / "mcp_config.json"
-    with open(config_path, 'r') as f:
+    global _config_cache
+    mtime_ns = os.stat(CONFIG_PATH).st_mtime_ns
+    if _config_cache is not None and _config_cache[0] == mtime_ns:
+        return _config_cache[1]
+
+    with open(CONFIG_PATH, 'r') as f:
         config_str = f.read()
     
     # Expand environment variables
     config_str = os.path.expandvars(config_str)
     
-    return json.loads(config_str)
+    config = orjson.loads(config_str)
+    _config_cache = (mtime_ns, config)
+    return config
@@ -0,0 +1,42 @@
+
+import asyncio
+from contextlib import AsyncExitStack
+
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
+
+
+class MCPSessionPool:
+    """
+    Long-lived MCP client sessions, one per server, kept open for the lifetime of the app.
+
+    Tools loaded from the pool are bound to these sessions, so tool calls reuse
+    the open connection (and stdio subprocess) instead of starting a new session
+    and handshake for every call. An MCP ClientSession multiplexes concurrent
+    requests, so a single session per server is shared by all callers.
+    """
+
+    def __init__(self, client: MultiServerMCPClient):
+        self._client = client
+        self._exit_stack = AsyncExitStack()
+        self._sessions = {}
+
+    async def connect(self, server_name: str):
+        """Open and initialize the session for a server; it stays open until close_all()."""
+        session = await self._exit_stack.enter_async_context(self._client.session(server_name))
+        self._sessions[server_name] = session
+        return session
+
+    def acquire(self, server_name: str):
+        """Return the open session for a server."""
+        return self._sessions[server_name]
+
+    async def get_tools(self):
+        """Load the tools of every connected server concurrently, bound to the pooled sessions."""
+        tool_lists = await asyncio.gather(*(load_mcp_tools(session) for session in self._sessions.values()))
+        return [tool for tools in tool_lists for tool in tools]
+
+    async def close_all(self):
+        """Close every session. Must run in the task that opened them (the app lifespan)."""
+        self._sessions.clear()
+        await self._exit_stack.aclose()
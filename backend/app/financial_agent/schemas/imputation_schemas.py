@@ -38,7 +38,7 @@ class SearchResult(BaseModel):
     credibility_score: Optional[float] = Field(default=None, description="Source credibility (0-1)")
     relevance_score: Optional[float] = Field(default=None, description="Relevance to query (0-1)")
     publish_date: Optional[datetime] = None
-    extracted_values: List[Union[float, str]] = Field(default=[], description="Financial values extracted")
+    extracted_values: List[Union[float, str]] = Field(default_factory=list, description="Financial values extracted")
     extraction_confidence: Optional[float] = Field(default=None, description="Confidence in extraction (0-1)")
 
 
@@ -46,8 +46,8 @@ class ValidationResult(BaseModel):
     """Result of validating an imputed data point."""
     is_valid: bool = Field(description="Whether the data point passed validation")
     validation_score: float = Field(description="Validation confidence score (0-1)")
-    validation_methods: List[str] = Field(default=[], description="Validation methods applied")
-    cross_references: List[str] = Field(default=[], description="Cross-reference sources used")
+    validation_methods: List[str] = Field(default_factory=list, description="Validation methods applied")
+    cross_references: List[str] = Field(default_factory=list, description="Cross-reference sources used")
     outlier_analysis: Optional[Dict[str, Any]] = None
     temporal_consistency: Optional[bool] = None
     industry_benchmark_check: Optional[Dict[str, Any]] = None
@@ -64,7 +64,7 @@ class ExtractedDataPoint(BaseModel):
     source_context: str = Field(description="Surrounding text context")
     extraction_confidence: float = Field(description="Confidence in extraction (0-1)")
     validation_result: Optional[ValidationResult] = None
-    metadata: Dict[str, Any] = Field(default={}, description="Additional metadata")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
 
 class ImputationAttempt(BaseModel):
@@ -72,12 +72,12 @@ class ImputationAttempt(BaseModel):
     field_name: str
     ticker: str
     search_queries: List[str] = Field(description="Queries used for search")
-    search_results: List[SearchResult] = Field(default=[])
-    extracted_data_points: List[ExtractedDataPoint] = Field(default=[])
+    search_results: List[SearchResult] = Field(default_factory=list)
+    extracted_data_points: List[ExtractedDataPoint] = Field(default_factory=list)
     final_value: Optional[Union[float, str]] = None
     confidence: float = Field(description="Overall confidence in imputed value (0-1)")
     success: bool = Field(description="Whether imputation was successful")
-    failure_reasons: List[str] = Field(default=[], description="Reasons for failure if unsuccessful")
+    failure_reasons: List[str] = Field(default_factory=list, description="Reasons for failure if unsuccessful")
     processing_time_ms: Optional[int] = None
     created_at: datetime = Field(default_factory=datetime.now)
 
@@ -89,9 +89,9 @@ class FieldRequirement(BaseModel):
     required_for_strategies: List[str] = Field(description="Strategies that require this field")
     data_type: str = Field(description="Expected data type (float, percentage, currency, etc.)")
     typical_range: Optional[Dict[str, float]] = Field(description="Typical value range for validation")
-    calculation_dependencies: List[str] = Field(default=[], description="Other fields needed for calculation")
-    search_keywords: List[str] = Field(default=[], description="Keywords for web search")
-    validation_rules: List[str] = Field(default=[], description="Validation rules to apply")
+    calculation_dependencies: List[str] = Field(default_factory=list, description="Other fields needed for calculation")
+    search_keywords: List[str] = Field(default_factory=list, description="Keywords for web search")
+    validation_rules: List[str] = Field(default_factory=list, description="Validation rules to apply")
     criticality: str = Field(description="Critical/Important/Optional")
 
 
@@ -100,8 +100,8 @@ class ImputationStrategy(BaseModel):
     name: str = Field(description="Strategy name")
     required_fields: List[FieldRequirement] = Field(description="Fields required by this strategy")
     field_priorities: Dict[str, int] = Field(description="Priority ranking of fields")
-    fallback_calculations: Dict[str, str] = Field(default={}, description="Alternative calculation methods")
-    quality_thresholds: Dict[str, float] = Field(default={}, description="Minimum quality thresholds")
+    fallback_calculations: Dict[str, str] = Field(default_factory=dict, description="Alternative calculation methods")
+    quality_thresholds: Dict[str, float] = Field(default_factory=dict, description="Minimum quality thresholds")
 
 
 class ImputationSession(BaseModel):
@@ -111,12 +111,12 @@ class ImputationSession(BaseModel):
     strategy: str
     started_at: datetime = Field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
-    attempts: List[ImputationAttempt] = Field(default=[])
+    attempts: List[ImputationAttempt] = Field(default_factory=list)
     overall_success_rate: float = Field(default=0.0)
     total_fields_requested: int = Field(default=0)
     successful_imputations: int = Field(default=0)
     session_summary: Optional[str] = None
-    performance_metrics: Dict[str, Any] = Field(default={})
+    performance_metrics: Dict[str, Any] = Field(default_factory=dict)
 
 
 class ImputationResult(BaseModel):
@@ -124,8 +124,8 @@ class ImputationResult(BaseModel):
     field_name: str
     imputed_value: Optional[Union[float, str]] = None
     confidence: float = Field(description="Confidence in imputed value (0-1)")
-    sources: List[str] = Field(default=[], description="URLs of data sources")
-    alternative_values: List[Union[float, str]] = Field(default=[], description="Alternative values found")
+    sources: List[str] = Field(default_factory=list, description="URLs of data sources")
+    alternative_values: List[Union[float, str]] = Field(default_factory=list, description="Alternative values found")
     validation_notes: Optional[str] = Field(default=None)
     extraction_method: Optional[str] = Field(default=None)
 
@@ -137,7 +137,7 @@ class SearchSummary(BaseModel):
     sources_found: int
     extraction_success: bool
     search_duration_ms: Optional[int] = None
-    errors: List[str] = Field(default=[])
+    errors: List[str] = Field(default_factory=list)
 
 
 class QualityMetrics(BaseModel):
@@ -148,4 +148,4 @@ class QualityMetrics(BaseModel):
     timeliness: float = Field(description="Recency of data sources")
     consistency: float = Field(description="Consistency across multiple sources")
     overall_quality: float = Field(description="Overall quality score")
-    quality_notes: List[str] = Field(default=[], description="Notes about quality assessment")
+    quality_notes: List[str] = Field(default_factory=list, description="Notes about quality assessment")
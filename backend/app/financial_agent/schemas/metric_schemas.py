@@ -40,12 +40,12 @@ class FinancialMetric(BaseModel):
     name: str = Field(description="Metric name")
     type: MetricType = Field(description="Type of metric")
     value: Optional[float] = Field(description="Calculated metric value")
-    historical_values: List[float] = Field(default=[], description="Historical values for trend analysis")
+    historical_values: List[float] = Field(default_factory=list, description="Historical values for trend analysis")
     confidence: float = Field(description="Confidence in the metric calculation (0-1)")
-    data_sources: List[DataSource] = Field(default=[], description="Sources used for calculation")
+    data_sources: List[DataSource] = Field(default_factory=list, description="Sources used for calculation")
     calculation_method: Optional[str] = Field(default=None, description="Method used for calculation")
-    missing_components: List[str] = Field(default=[], description="Missing data components")
-    alternative_calculations: List[Dict[str, Any]] = Field(default=[], description="Alternative calculation methods tried")
+    missing_components: List[str] = Field(default_factory=list, description="Missing data components")
+    alternative_calculations: List[Dict[str, Any]] = Field(default_factory=list, description="Alternative calculation methods tried")
     interpretation: Optional[str] = Field(default=None, description="Interpretation of the metric value")
     benchmark_comparison: Optional[Dict[str, float]] = Field(default=None, description="Comparison to benchmarks")
 
@@ -85,11 +85,11 @@ class DataGapAnalysis(BaseModel):
     """Analysis of missing data points for a strategy."""
     strategy: str = Field(description="Analysis strategy")
     ticker: str = Field(description="Stock ticker")
-    critical_missing: List[str] = Field(default=[], description="Critical missing fields that prevent analysis")
-    important_missing: List[str] = Field(default=[], description="Important missing fields that reduce quality")
-    optional_missing: List[str] = Field(default=[], description="Optional missing fields")
-    search_priority: Dict[str, int] = Field(default={}, description="Search priority ranking for each field")
-    impact_assessment: Dict[str, str] = Field(default={}, description="Impact of each missing field")
+    critical_missing: List[str] = Field(default_factory=list, description="Critical missing fields that prevent analysis")
+    important_missing: List[str] = Field(default_factory=list, description="Important missing fields that reduce quality")
+    optional_missing: List[str] = Field(default_factory=list, description="Optional missing fields")
+    search_priority: Dict[str, int] = Field(default_factory=dict, description="Search priority ranking for each field")
+    impact_assessment: Dict[str, str] = Field(default_factory=dict, description="Impact of each missing field")
 
 
 class TrendAnalysis(BaseModel):
@@ -98,7 +98,7 @@ class TrendAnalysis(BaseModel):
     direction: str = Field(description="Trend direction (improving/declining/stable)")
     strength: float = Field(description="Strength of trend (0-1)")
     consistency: float = Field(description="Consistency of trend (0-1)")
-    inflection_points: List[str] = Field(default=[], description="Dates of significant changes")
+    inflection_points: List[str] = Field(default_factory=list, description="Dates of significant changes")
     forecast: Optional[Dict[str, float]] = Field(default=None, description="Future trend forecast")
 
 
@@ -106,9 +106,9 @@ class InvestmentRecommendation(BaseModel):
     """Investment recommendation based on analysis."""
     recommendation: str = Field(description="Buy/Hold/Sell recommendation")
     confidence: float = Field(description="Confidence in recommendation (0-1)")
-    reasoning: List[str] = Field(default=[], description="Key reasons for recommendation")
-    risk_factors: List[str] = Field(default=[], description="Identified risk factors")
-    strengths: List[str] = Field(default=[], description="Company strengths identified")
+    reasoning: List[str] = Field(default_factory=list, description="Key reasons for recommendation")
+    risk_factors: List[str] = Field(default_factory=list, description="Identified risk factors")
+    strengths: List[str] = Field(default_factory=list, description="Company strengths identified")
     price_targets: Optional[Dict[str, float]] = Field(default=None, description="Price targets (conservative/optimistic)")
     time_horizon: Optional[str] = Field(default=None, description="Recommended holding period")
 
@@ -121,8 +121,8 @@ class ComprehensiveAnalysis(BaseModel):
     phil_town_metrics: Optional[PhilTownMetrics] = None
     high_growth_metrics: Optional[HighGrowthMetrics] = None
     data_gap_analysis: DataGapAnalysis
-    trend_analysis: List[TrendAnalysis] = Field(default=[])
+    trend_analysis: List[TrendAnalysis] = Field(default_factory=list)
     recommendation: InvestmentRecommendation
     overall_confidence: float = Field(description="Overall confidence in analysis (0-1)")
     data_quality_score: float = Field(description="Overall data quality score (0-1)")
-    execution_summary: Dict[str, Any] = Field(default={}, description="Summary of analysis execution")
\ No newline at end of file
+    execution_summary: Dict[str, Any] = Field(default_factory=dict, description="Summary of analysis execution")
\ No newline at end of file
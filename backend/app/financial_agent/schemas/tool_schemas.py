@@ -35,9 +35,9 @@ class DataQualityAssessment(BaseModel):
     """Assessment of data quality and completeness."""
     completeness_score: float = Field(description="Data completeness score (0-1)")
     reliability_score: float = Field(description="Data reliability score (0-1)")
-    missing_critical_fields: List[str] = Field(default=[], description="Critical missing fields")
-    missing_optional_fields: List[str] = Field(default=[], description="Optional missing fields")
-    data_sources: Dict[str, str] = Field(default={}, description="Data sources used")
+    missing_critical_fields: List[str] = Field(default_factory=list, description="Critical missing fields")
+    missing_optional_fields: List[str] = Field(default_factory=list, description="Optional missing fields")
+    data_sources: Dict[str, str] = Field(default_factory=dict, description="Data sources used")
 
 
 class ConfidenceScore(BaseModel):
@@ -55,12 +55,12 @@ class MetricComputationOutput(BaseModel):
     strategy: AnalysisStrategy
     primary_data_quality: DataQualityAssessment
     imputation_attempted: bool
-    imputation_results: Dict[str, Any] = Field(default={})
-    final_metrics: Dict[str, Any] = Field(default={})
-    confidence_scores: Dict[str, ConfidenceScore] = Field(default={})
+    imputation_results: Dict[str, Any] = Field(default_factory=dict)
+    final_metrics: Dict[str, Any] = Field(default_factory=dict)
+    confidence_scores: Dict[str, ConfidenceScore] = Field(default_factory=dict)
     analysis_summary: Optional[str] = Field(default=None)
-    recommendations: List[str] = Field(default=[])
-    data_sources: Dict[str, List[str]] = Field(default={})
+    recommendations: List[str] = Field(default_factory=list)
+    data_sources: Dict[str, List[str]] = Field(default_factory=dict)
 
 
 class ImputationOutput(BaseModel):
@@ -68,8 +68,8 @@ class ImputationOutput(BaseModel):
     ticker: str
     requested_fields: List[str]
     strategy_context: Optional[str]
-    imputation_results: Dict[str, ImputationResult] = Field(default={})
-    search_summary: Dict[str, SearchSummary] = Field(default={})
+    imputation_results: Dict[str, ImputationResult] = Field(default_factory=dict)
+    search_summary: Dict[str, SearchSummary] = Field(default_factory=dict)
     data_quality_assessment: QualityMetrics
     overall_success_rate: float = Field(description="Percentage of fields successfully imputed")
     execution_time_ms: Optional[int] = None
@@ -285,14 +285,16 @@ class WebDataImputationTool(BaseTool):
         if not attempt.extracted_data_points:
             return attempt
         
+        # Score the sources of all data points in one batch, off the event loop
+        credibility_scores = await asyncio.to_thread(
+            self.credibility_ranker.score_sources_batch,
+            [(point.source_url, point.source_context, point.field_name) for point in attempt.extracted_data_points]
+        )
+        
         # Score each data point
         scored_points = []
-        for point in attempt.extracted_data_points:
+        for point, credibility_score in zip(attempt.extracted_data_points, credibility_scores):
             # Calculate overall score based on multiple factors
-            credibility_score = self.credibility_ranker.score_source_credibility(
-                point.source_url, point.source_context, point.field_name
-            )
-            
             # Combine scores
             overall_score = (
                 point.extraction_confidence * 0.4 +
@@ -17,6 +17,11 @@ from functools import lru_cache
 FMP_API_KEY = os.environ.get("FMP_API_KEY", "")
 FMP_BASE_URL = "https://financialmodelingprep.com/stable"
 
+# Shared keep-alive session so the several calls behind one fetch reuse TLS connections
+FMP_POOL_MAXSIZE = 16
+_fmp_session = requests.Session()
+_fmp_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=FMP_POOL_MAXSIZE))
+
 
 def _make_fmp_request(endpoint: str, params: Optional[Dict] = None) -> Optional[Dict | List]:
     """Make a request to the FMP API with error handling."""
@@ -30,7 +35,7 @@ def _make_fmp_request(endpoint: str, params: Optional[Dict] = None) -> Optional[
         if params:
             request_params.update(params)
         
-        response = requests.get(url, params=request_params, timeout=10)
+        response = _fmp_session.get(url, params=request_params, timeout=10)
         
         if response.status_code == 200:
             return response.json()
@@ -640,7 +645,7 @@ def search_fmp(query: str, limit: int = 10) -> List[Dict[str, str]]:
             "apikey": FMP_API_KEY
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _fmp_session.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
             results = response.json()
@@ -673,7 +678,7 @@ def search_fmp(query: str, limit: int = 10) -> List[Dict[str, str]]:
             "apikey": FMP_API_KEY
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _fmp_session.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
             results = response.json()
@@ -1,9 +1,11 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.routers import stocks, analysis, criteria, chat, auth, portfolio, watchlist, earnings
 from app.database import init_db, close_db
+from app.dependencies import create_llm, create_mcp_session_pool, init_agent_dependencies
 
 
 @asynccontextmanager
@@ -15,9 +17,29 @@ async def lifespan(app: FastAPI):
     print("Initializing database...")
     await init_db()
     print("Database initialized successfully!")
+
+    # Startup: Initialize the financial agent (LLM, MCP and analysis tools)
+    print("Initializing agent dependencies...")
+    app.state.mcp_pool = None
+    app.state.agent_deps = None
+    # The LLM is built in a worker thread while the MCP sessions open in this task
+    llm_task = asyncio.create_task(create_llm())
+    try:
+        app.state.mcp_pool = await create_mcp_session_pool()
+        app.state.agent_deps = await init_agent_dependencies(app.state.mcp_pool, await llm_task)
+        print("Agent dependencies initialized successfully!")
+    except Exception as e:
+        llm_task.cancel()
+        # Keep serving the non-agent endpoints; agent routes answer 503
+        print(f"Agent dependencies failed to initialize: {e}")
     
     yield
     
+    # Shutdown: Close the persistent MCP sessions
+    if app.state.mcp_pool is not None:
+        print("Closing MCP sessions...")
+        await app.state.mcp_pool.close_all()
+    
     # Shutdown: Close database connections
     print("Closing database connections...")
     await close_db()
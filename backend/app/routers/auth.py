@@ -2,7 +2,7 @@
 Authentication router for user registration, login, and token management.
 """
 
-from uuid import UUID
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -10,9 +10,9 @@ from sqlalchemy import select
 from ..database import get_db
 from ..models.user import User
 from ..schemas.auth import UserCreate, UserLogin, UserResponse, Token, TokenRefresh
-from ..auth.security import verify_password, get_password_hash
+from ..auth.security import averify_password, aget_password_hash
 from ..auth.jwt import create_access_token, create_refresh_token, decode_token
-from ..dependencies import get_current_user
+from ..dependencies import AuthenticatedUser, get_current_user, get_optional_current_user, invalidate_cached_user
 
 router = APIRouter(
     prefix="/auth",
@@ -43,7 +43,7 @@ async def register(
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await aget_password_hash(user_data.password)
     new_user = User(
         email=user_data.email,
         hashed_password=hashed_password,
@@ -83,7 +83,7 @@ async def login(
     )
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    if not user or not await averify_password(credentials.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -131,7 +131,7 @@ async def refresh_token(
     
     # Get user from database
     result = await db.execute(
-        select(User).where(User.id == UUID(token_payload.user_id))
+        select(User).where(User.id == token_payload.user_id)
     )
     user = result.scalar_one_or_none()
     
@@ -158,7 +158,7 @@ async def refresh_token(
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     """
     Get the currently authenticated user's information.
@@ -167,7 +167,9 @@ async def get_current_user_info(
 
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
-async def logout():
+async def logout(
+    current_user: Optional[AuthenticatedUser] = Depends(get_optional_current_user),
+):
     """
     Logout the current user.
     
@@ -178,4 +180,6 @@ async def logout():
     # In a production environment, you might want to:
     # 1. Add the token to a blacklist
     # 2. Remove any server-side session data
+    if current_user is not None:
+        invalidate_cached_user(current_user.id)
     return None
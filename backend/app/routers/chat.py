@@ -5,7 +5,6 @@ from pydantic import BaseModel
 import os
 import asyncio
 from typing import Dict, Any, Optional
-from app.financial_agent.graph import graph
 from app.financial_agent.llm import ChatOpenRouter
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from app.financial_agent.mcp_config.config import load_mcp_config
@@ -34,9 +33,9 @@ async def chat(
     """
     Handles a chat request by invoking the financial agent graph.
 
-    This endpoint receives a user's message and a thread ID, injects the
-    necessary dependencies (LLM, tools, tool maps), and then calls the
-    LangGraph agent to get a response.
+    This endpoint receives a user's message and a thread ID, and calls the
+    LangGraph agent compiled at startup with its dependencies (LLM, tools,
+    tool maps) already bound to get a response.
 
     Args:
         request: A ChatRequest object containing the user's message and thread ID.
@@ -50,9 +49,6 @@ async def chat(
     config = {
         "configurable": {
             "thread_id": request.thread_id,
-            "llm": agent_deps.llm,
-            "tools": agent_deps.tools_for_llm,
-            "tools_map": agent_deps.tools_map,
         }
     }
 
@@ -90,7 +86,7 @@ The [SWITCH_TAB: ...] command will be automatically removed from what the user s
 
     try:
         logger.info(f"Invoking agent with messages: {messages}")
-        response = await graph.ainvoke({"messages": messages}, config)
+        response = await agent_deps.graph.ainvoke({"messages": messages}, config)
         logger.info(f"Agent response: {response}")
         
         # Return the last message from the agent's response
@@ -10,7 +10,6 @@ from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from ..database import get_db
-from ..models.user import User
 from ..models.portfolio import Portfolio, PortfolioHolding
 from ..schemas.portfolio import (
     PortfolioCreate,
@@ -21,7 +20,7 @@ from ..schemas.portfolio import (
     HoldingUpdate,
     HoldingResponse,
 )
-from ..dependencies import get_current_active_user
+from ..dependencies import AuthenticatedUser, get_current_active_user
 
 router = APIRouter(
     prefix="/portfolios",
@@ -32,7 +31,7 @@ router = APIRouter(
 @router.get("", response_model=PortfolioListResponse)
 async def list_portfolios(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Get all portfolios for the current user.
@@ -55,7 +54,7 @@ async def list_portfolios(
 async def create_portfolio(
     portfolio_data: PortfolioCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Create a new portfolio for the current user.
@@ -77,7 +76,7 @@ async def create_portfolio(
 async def get_portfolio(
     portfolio_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Get a specific portfolio by ID.
@@ -103,7 +102,7 @@ async def update_portfolio(
     portfolio_id: UUID,
     portfolio_data: PortfolioUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Update a portfolio's name and/or description.
@@ -136,7 +135,7 @@ async def update_portfolio(
 async def delete_portfolio(
     portfolio_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Delete a portfolio and all its holdings.
@@ -167,7 +166,7 @@ async def add_stock_to_portfolio(
     portfolio_id: UUID,
     holding_data: HoldingCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Add a stock to a portfolio.
@@ -223,7 +222,7 @@ async def update_stock_in_portfolio(
     ticker: str,
     holding_data: HoldingUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Update a stock holding in a portfolio.
@@ -276,7 +275,7 @@ async def remove_stock_from_portfolio(
     portfolio_id: UUID,
     ticker: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Remove a stock from a portfolio.
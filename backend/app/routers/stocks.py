@@ -1,5 +1,5 @@
 from fastapi import APIRouter, HTTPException
-from ..data_fetcher import fetch_stock_data, get_safe_value
+from ..data_fetcher import fetch_stock_data_async, get_safe_value
 from ..analysis import clean_data
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, List
@@ -94,7 +94,7 @@ async def get_stock_profile(ticker: str, source: Optional[str] = None):
         ticker: Stock ticker symbol
         source: Data source preference ("yfinance" or "fmp")
     """
-    stock_data = fetch_stock_data(ticker, source=source)
+    stock_data = await fetch_stock_data_async(ticker, source=source)
     info = stock_data.get("info", {})
 
     if not info or info.get('longName') is None:
@@ -128,7 +128,7 @@ async def get_stock_quote(ticker: str, source: Optional[str] = None):
         ticker: Stock ticker symbol
         source: Data source preference ("yfinance" or "fmp")
     """
-    stock_data = fetch_stock_data(ticker, source=source)
+    stock_data = await fetch_stock_data_async(ticker, source=source)
     info = stock_data.get("info", {})
 
     if not info or info.get('longName') is None:
@@ -165,7 +165,7 @@ async def get_stock_financials(ticker: str, statement_type: str = "annual", sour
     """
     Retrieves the annual income statement for a given stock ticker.
     """
-    stock_data = fetch_stock_data(ticker, source=source)
+    stock_data = await fetch_stock_data_async(ticker, source=source)
     info = stock_data.get("info", {})
 
     if not info or info.get('longName') is None:
@@ -204,7 +204,7 @@ async def get_stock_price_history(ticker: str, period: str = "1y"):
     Retrieves historical price data for a given stock ticker.
     Default period is 1 year.
     """
-    stock_data = fetch_stock_data(ticker)
+    stock_data = await fetch_stock_data_async(ticker)
     info = stock_data.get("info", {})
 
     if not info or info.get('longName') is None:
@@ -295,7 +295,7 @@ async def search_stocks(q: str, source: Optional[str] = None):
         
         # If yfinance Search didn't find anything, fall back to direct ticker lookup
         if not results:
-            stock_data = fetch_stock_data(query.upper(), source=source)
+            stock_data = await fetch_stock_data_async(query.upper(), source=source)
             info = stock_data.get("info", {})
             
             if info and info.get('longName'):
@@ -309,7 +309,7 @@ async def search_stocks(q: str, source: Optional[str] = None):
         
         # Final fallback: try direct ticker lookup
         try:
-            stock_data = fetch_stock_data(query.upper(), source=source)
+            stock_data = await fetch_stock_data_async(query.upper(), source=source)
             info = stock_data.get("info", {})
             
             if info and info.get('longName'):
@@ -327,7 +327,7 @@ async def get_key_metrics(ticker: str, source: Optional[str] = None):
     """
     Retrieves key metrics for a given stock ticker.
     """
-    stock_data = fetch_stock_data(ticker, source=source)
+    stock_data = await fetch_stock_data_async(ticker, source=source)
     info = stock_data.get("info", {})
 
     if not info or info.get('longName') is None:
@@ -389,7 +389,7 @@ async def get_balance_sheet(ticker: str, statement_type: str = "annual"):
     """
     Retrieves the annual or quarterly balance sheet for a given stock ticker.
     """
-    stock_data = fetch_stock_data(ticker)
+    stock_data = await fetch_stock_data_async(ticker)
     info = stock_data.get("info", {})
     
     if not info or info.get('longName') is None:
@@ -431,7 +431,7 @@ async def get_cash_flow(ticker: str, statement_type: str = "annual"):
     """
     Retrieves the annual or quarterly cash flow statement for a given stock ticker.
     """
-    stock_data = fetch_stock_data(ticker)
+    stock_data = await fetch_stock_data_async(ticker)
     info = stock_data.get("info", {})
     
     if not info or info.get('longName') is None:
@@ -475,7 +475,7 @@ async def get_dividends(ticker: str):
     """
     Retrieves the dividend history for a given stock ticker.
     """
-    stock_data = fetch_stock_data(ticker)
+    stock_data = await fetch_stock_data_async(ticker)
     info = stock_data.get("info", {})
     
     if not info or info.get('longName') is None:
@@ -10,7 +10,6 @@ from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from ..database import get_db
-from ..models.user import User
 from ..models.watchlist import Watchlist, WatchlistItem
 from ..schemas.watchlist import (
     WatchlistCreate,
@@ -21,7 +20,7 @@ from ..schemas.watchlist import (
     WatchlistItemUpdate,
     WatchlistItemResponse,
 )
-from ..dependencies import get_current_active_user
+from ..dependencies import AuthenticatedUser, get_current_active_user
 
 router = APIRouter(
     prefix="/watchlists",
@@ -32,7 +31,7 @@ router = APIRouter(
 @router.get("", response_model=WatchlistListResponse)
 async def list_watchlists(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Get all watchlists for the current user.
@@ -55,7 +54,7 @@ async def list_watchlists(
 async def create_watchlist(
     watchlist_data: WatchlistCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Create a new watchlist for the current user.
@@ -76,7 +75,7 @@ async def create_watchlist(
 async def get_watchlist(
     watchlist_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Get a specific watchlist by ID.
@@ -102,7 +101,7 @@ async def update_watchlist(
     watchlist_id: UUID,
     watchlist_data: WatchlistUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Update a watchlist's name.
@@ -133,7 +132,7 @@ async def update_watchlist(
 async def delete_watchlist(
     watchlist_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Delete a watchlist and all its items.
@@ -164,7 +163,7 @@ async def add_stock_to_watchlist(
     watchlist_id: UUID,
     item_data: WatchlistItemCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Add a stock to a watchlist.
@@ -219,7 +218,7 @@ async def update_stock_in_watchlist(
     ticker: str,
     item_data: WatchlistItemUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Update a stock in a watchlist.
@@ -270,7 +269,7 @@ async def remove_stock_from_watchlist(
     watchlist_id: UUID,
     ticker: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
 ):
     """
     Remove a stock from a watchlist.
@@ -0,0 +1,99 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from app.analysis import calculate_cagr, calculate_net_margins, calculate_roic_phil_town, clean_data
+
+# --- Tests for clean_data ---
+def test_clean_data_replaces_non_finite_floats():
+    """
+    Tests that NaN and +/-Inf are replaced with None at any nesting depth.
+    """
+    data = {"a": [1.0, float("nan"), {"b": float("inf")}], "c": float("-inf"), "d": "text", "e": 3}
+    assert clean_data(data) == {"a": [1.0, None, {"b": None}], "c": None, "d": "text", "e": 3}
+
+def test_clean_data_handles_numpy_floats():
+    """
+    Tests that numpy float scalars (a float subclass) are sanitized too.
+    """
+    cleaned = clean_data([np.float64("nan"), np.float64(2.5)])
+    assert cleaned[0] is None
+    assert math.isclose(cleaned[1], 2.5)
+
+# --- Tests for calculate_cagr ---
+def test_calculate_cagr_sorts_by_date_and_skips_missing():
+    """
+    Tests that yfinance-style newest-first columns are ordered oldest-first and NaNs are ignored.
+    """
+    dates = pd.to_datetime(["2024-12-31", "2023-12-31", "2022-12-31", "2021-12-31"])
+    series = pd.Series([121.0, np.nan, 110.0, 100.0], index=dates)
+    assert math.isclose(calculate_cagr(series), 0.1)
+
+def test_calculate_cagr_limits_window():
+    """
+    Tests that only the most recent `years_to_consider` periods are used.
+    """
+    series = pd.Series([1.0, 100.0, 200.0], index=[2020, 2021, 2022])
+    assert math.isclose(calculate_cagr(series, years_to_consider=1), 1.0)
+
+def test_calculate_cagr_sign_change_returns_none():
+    """
+    Tests that a CAGR is not reported when the series crosses zero.
+    """
+    assert calculate_cagr(pd.Series([-10.0, 5.0], index=[2020, 2021])) is None
+    assert calculate_cagr(pd.Series([0.0, 5.0], index=[2020, 2021])) is None
+    assert calculate_cagr(pd.Series([5.0], index=[2020])) is None
+
+# --- Tests for calculate_roic_phil_town ---
+def test_calculate_roic_phil_town_uses_effective_tax_rate():
+    """
+    Tests NOPAT / (equity + long-term debt) per year, newest first, with the default tax rate as fallback.
+    """
+    years = pd.to_datetime(["2023-12-31", "2024-12-31"])
+    financials = pd.DataFrame({years[0]: [100.0, 200.0, 0.0], years[1]: [200.0, 400.0, 100.0]},
+                              index=["EBIT", "Pretax Income", "Tax Provision"])
+    balance_sheet = pd.DataFrame({years[0]: [600.0, 400.0], years[1]: [800.0, 200.0]},
+                                 index=["Stockholders Equity", "Long Term Debt"])
+    avg_roic, roics = calculate_roic_phil_town(financials, balance_sheet)
+    assert np.allclose(roics, [200 * 0.75 / 1000, 100 * 0.79 / 1000])
+    assert math.isclose(avg_roic, sum(roics) / 2)
+
+def test_calculate_roic_phil_town_falls_back_to_operating_income():
+    """
+    Tests the Operating Income fallback when EBIT and its components are unavailable.
+    """
+    financials = pd.DataFrame({"2024": [50.0]}, index=["Operating Income"])
+    balance_sheet = pd.DataFrame({"2024": [500.0, 100.0, 0.0]}, index=["Stockholders Equity", "Total Debt", "Current Debt"])
+    avg_roic, roics = calculate_roic_phil_town(financials, balance_sheet)
+    assert math.isclose(avg_roic, 50 * 0.79 / 600)
+    assert calculate_roic_phil_town(pd.DataFrame(), balance_sheet) == (None, [])
+
+# --- Tests for calculate_net_margins ---
+def test_calculate_net_margins_returns_recent_margins_oldest_first():
+    """
+    Tests that margins are ordered oldest-first, limited to the window, and skip zero revenue.
+    """
+    years = pd.to_datetime(["2024-12-31", "2023-12-31", "2022-12-31", "2021-12-31"])
+    financials = pd.DataFrame([[30.0, 20.0, 5.0, 1.0], [100.0, 100.0, 0.0, 10.0]],
+                              index=["Net Income", "Total Revenue"], columns=years)
+    margins, trend = calculate_net_margins(financials, years_to_consider=2)
+    assert np.allclose(margins, [0.2, 0.3])
+    assert trend == "Expanding"
+
+def test_calculate_net_margins_trend_uses_slope_not_endpoints():
+    """
+    Tests that the trend follows the least-squares slope of the window rather than first vs last margin.
+    """
+    financials = pd.DataFrame([[10.0, 5.0, 20.0, 25.0, 9.0], [100.0] * 5],
+                              index=["Net Income", "Total Revenue"], columns=[2020, 2021, 2022, 2023, 2024])
+    assert calculate_net_margins(financials)[1] == "Expanding"
+    financials.loc["Net Income"] = 10.0
+    assert calculate_net_margins(financials)[1] == "Stable"
+
+def test_calculate_net_margins_accepts_object_dtype():
+    """
+    Tests that object-dtype statements (as built from FMP payloads) are coerced to numbers.
+    """
+    financials = pd.DataFrame({"2023": [5, 50], "2024": ["n/a", 80]}, index=["Net Income", "Total Revenue"], dtype=object)
+    assert calculate_net_margins(financials) == ([0.1], "Not enough data for trend")
@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from jose import jwt
+
+from app.auth.jwt import ALGORITHM, SECRET_KEY, _hs256_encode, create_access_token, create_refresh_token, decode_token
+
+# --- Tests for token encoding ---
+def test_hs256_encode_matches_jose():
+    """
+    Tests that the direct HS256 encoder produces byte-identical tokens to python-jose.
+    """
+    now = datetime.now(timezone.utc)
+    payload = {"sub": "user-id", "email": "user@example.com", "exp": now + timedelta(minutes=5), "type": "access", "iat": now}
+    assert _hs256_encode(payload) == jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+
+def test_tokens_round_trip_through_decode():
+    """
+    Tests that access and refresh tokens decode back to their claims and type.
+    """
+    user_id = uuid4()
+    data = {"sub": str(user_id), "email": "user@example.com"}
+    access = decode_token(create_access_token(data))
+    refresh = decode_token(create_refresh_token(data))
+    assert (access.user_id, access.email, access.token_type) == (user_id, "user@example.com", "access")
+    assert refresh.token_type == "refresh"
+    header, payload, signature = create_access_token(data).split(".")
+    forged_payload = create_access_token({"sub": str(uuid4())}).split(".")[1]
+    assert decode_token(f"{header}.{forged_payload}.{signature}") is None
+    assert decode_token(create_access_token({"sub": "not-a-uuid"})) is None
+    assert decode_token(create_access_token({"email": "user@example.com"})) is None
@@ -0,0 +1,197 @@
+import asyncio
+import math
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app import data_fetcher
+from app.data_fetcher import convert_financial_series_to_float, convert_financial_string_to_float
+
+# --- Tests for convert_financial_series_to_float ---
+def test_convert_financial_series_matches_scalar_parser():
+    """
+    Tests that the vectorized parser agrees with the scalar one, with NaN where the scalar returns None.
+    """
+    values = ["1,234.5", "2.5B", "3m", "4k", "12%", "-3.2M", " 7 ", "n/a", "-", "", "abc", "5%B", 5, 2.5, None]
+    converted = convert_financial_series_to_float(pd.Series(values, dtype=object))
+    for raw, vectorized in zip(values, converted):
+        scalar = convert_financial_string_to_float(raw)
+        if scalar is None:
+            assert math.isnan(vectorized)
+        else:
+            assert math.isclose(vectorized, scalar)
+
+def test_convert_financial_series_without_strings():
+    """
+    Tests that numeric and all-missing series are converted without the string accessor.
+    """
+    assert convert_financial_series_to_float(pd.Series([1, 2])).tolist() == [1.0, 2.0]
+    assert convert_financial_series_to_float(pd.Series([None, 3], dtype=object)).isna().tolist() == [True, False]
+
+# --- Tests for _fetch_yf_statements ---
+class _FakeTicker:
+    """Stands in for yf.Ticker, returning a one-cell frame for each available statement."""
+
+    def __init__(self, available, failing=(), slow=()):
+        self.available = available
+        self.failing = failing
+        self.slow = slow
+        self.release = threading.Event()
+        self.calls = 0
+
+    def __getattr__(self, key):
+        if key not in data_fetcher.YF_STATEMENT_ATTRIBUTES:
+            raise AttributeError(key)
+        self.calls += 1
+        if key in self.failing:
+            raise ConnectionError(key)
+        if key in self.slow:
+            self.release.wait(5)
+        return pd.DataFrame({"value": [1.0]}) if key in self.available else pd.DataFrame()
+
+def _fetch_statements_twice(monkeypatch, ticker):
+    monkeypatch.setattr(data_fetcher.yf, "Ticker", lambda symbol: ticker)
+    data_fetcher._fetch_yf_statements_cached.cache_clear()
+    try:
+        first = data_fetcher._fetch_yf_statements("TEST")
+        second = data_fetcher._fetch_yf_statements("TEST")
+    finally:
+        data_fetcher._fetch_yf_statements_cached.cache_clear()
+    return first, second
+
+def test_fetch_yf_statements_caches_complete_results(monkeypatch):
+    """
+    Tests that statements including every required one are kept in the long-lived lane.
+    """
+    ticker = _FakeTicker(data_fetcher.YF_STATEMENT_ATTRIBUTES)
+    first, second = _fetch_statements_twice(monkeypatch, ticker)
+    assert set(first) == set(data_fetcher.YF_STATEMENT_ATTRIBUTES)
+    assert second is first
+    assert ticker.calls == len(data_fetcher.YF_STATEMENT_ATTRIBUTES)
+
+def test_fetch_yf_statements_does_not_cache_partial_results(monkeypatch):
+    """
+    Tests that partial statements are returned but refetched on the next call instead of being cached for a day.
+    """
+    ticker = _FakeTicker(("financials", "balance_sheet", "dividends"))
+    first, second = _fetch_statements_twice(monkeypatch, ticker)
+    assert set(first) == {"financials", "balance_sheet", "dividends"}
+    assert set(second) == set(first)
+    assert ticker.calls == 2 * len(data_fetcher.YF_STATEMENT_ATTRIBUTES)
+
+def test_fetch_yf_statements_does_not_cache_failed_scrapes(monkeypatch):
+    """
+    Tests that a statement scrape that raised or timed out keeps the result out of the long-lived lane.
+    """
+    ticker = _FakeTicker(data_fetcher.YF_STATEMENT_ATTRIBUTES, failing=("major_holders",))
+    first, second = _fetch_statements_twice(monkeypatch, ticker)
+    assert "major_holders" not in first and "financials" in first
+    assert ticker.calls == 2 * len(data_fetcher.YF_STATEMENT_ATTRIBUTES)
+
+    monkeypatch.setattr(data_fetcher, "PROVIDER_FETCH_TIMEOUT_SECONDS", 0.2)
+    ticker = _FakeTicker(data_fetcher.YF_STATEMENT_ATTRIBUTES, slow=("dividends",))
+    try:
+        first, second = _fetch_statements_twice(monkeypatch, ticker)
+    finally:
+        ticker.release.set()
+    assert "dividends" not in first and "financials" in first
+    assert second is not first
+
+# --- Tests for the shared cache encoding ---
+def test_shared_cache_entry_round_trip(monkeypatch):
+    """
+    Tests that a payload survives the JSON (and Parquet) shared-cache encoding exactly, empty tables included.
+    """
+    small = 1.23456789012345e-05
+    financials = pd.DataFrame([[small, 3.0], [None, 1 / 3]], index=["Total Revenue", "Net Income"],
+                              columns=pd.DatetimeIndex(["2023-12-31", "2022-12-31"]).as_unit("ns"))
+    dates = pd.DatetimeIndex(["2023-01-05", "2023-04-05"], name="Date").tz_localize("America/New_York").as_unit("ns")
+    dividends = pd.Series([0.2, 0.25], index=dates, name="Dividends")
+    history = pd.DataFrame({"Close": [small, 2.0000000001], "Volume": [100, 200]}, index=dates)
+    info = {"symbol": "TEST", "trailingPE": 12.5, "sharesOutstanding": np.int64(5), "beta": np.float64(1.5), "tiny": small}
+    data = data_fetcher._empty_stock_data("yfinance")
+    data.update(info=info, financials=financials, dividends=dividends, history=history)
+
+    for parquet_available in {data_fetcher.parquet_available, False}:
+        monkeypatch.setattr(data_fetcher, "parquet_available", parquet_available)
+        blob = data_fetcher._encode_shared_cache_entry(data)
+        assert not blob.startswith(b"\x80")  # Not a pickle
+        decoded = data_fetcher._decode_shared_cache_entry(blob)
+        assert decoded["info"] == info and decoded["data_source"] == "yfinance"
+        assert type(decoded["info"]["sharesOutstanding"]) is int and type(decoded["info"]["beta"]) is float
+        assert decoded["info"]["tiny"] == small
+        pd.testing.assert_frame_equal(decoded["financials"], financials, check_exact=True)
+        pd.testing.assert_series_equal(decoded["dividends"], dividends, check_exact=True, check_freq=False)
+        pd.testing.assert_frame_equal(decoded["history"], history, check_exact=True, check_freq=False)
+        assert decoded["balance_sheet"] is data_fetcher._EMPTY_FRAME
+
+def test_shared_cache_entry_rejects_values_json_cannot_carry():
+    """
+    Tests that a payload with a value JSON would alter is refused instead of being stored as a string.
+    """
+    data = data_fetcher._empty_stock_data("yfinance")
+    data["info"] = {"symbol": "TEST", "exDividendDate": pd.Timestamp("2024-01-01")}
+    with pytest.raises(TypeError):
+        data_fetcher._encode_shared_cache_entry(data)
+
+# --- Tests for fetch_stock_data_batch ---
+class _FakeRedis:
+    """Stands in for the shared Redis client, recording every MGET."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.mgets = []
+
+    def mget(self, keys):
+        self.mgets.append(list(keys))
+        return [self.entries.get(key) for key in keys]
+
+def test_fetch_stock_data_batch_fans_out_concurrently(monkeypatch):
+    """
+    Tests that the tickers of a batch are fetched at the same time, and that one failing ticker only empties its own entry.
+    """
+    tickers = ["AAA", "BBB", "CCC", "FAIL"]
+    # Every fetch waits until all of them have started, so a sequential fan-out would time out here
+    all_started = threading.Barrier(len(tickers), timeout=5)
+
+    def fake_fetch(ticker, timestamp):
+        all_started.wait()
+        if ticker == "FAIL":
+            raise ConnectionError(ticker)
+        data = data_fetcher._empty_stock_data("yfinance")
+        data["info"] = {"symbol": ticker}
+        return data
+
+    monkeypatch.setattr(data_fetcher, "_fetch_stock_data_coalesced", fake_fetch)
+    monkeypatch.setattr(data_fetcher, "_redis_client", None)
+    results = asyncio.run(data_fetcher.fetch_stock_data_batch(tickers + ["AAA"]))
+
+    assert list(results) == tickers
+    for ticker in ("AAA", "BBB", "CCC"):
+        assert results[ticker]["info"] == {"symbol": ticker}
+    assert results["FAIL"]["info"] == {} and results["FAIL"]["data_source"] == "unknown"
+
+def test_fetch_stock_data_batch_reads_shared_cache_in_one_round_trip(monkeypatch):
+    """
+    Tests that shared-cache hits come from a single MGET and only the misses go upstream.
+    """
+    timestamp = data_fetcher._cache_timestamp()
+    cached = data_fetcher._empty_stock_data("yfinance")
+    cached["info"] = {"symbol": "HIT"}
+    redis = _FakeRedis({data_fetcher._shared_cache_key("HIT", timestamp): data_fetcher._encode_shared_cache_entry(cached)})
+    fetched = []
+
+    def fake_fetch(ticker, timestamp):
+        fetched.append(ticker)
+        return data_fetcher._empty_stock_data("yfinance")
+
+    monkeypatch.setattr(data_fetcher, "_cache_timestamp", lambda ttl_seconds=None: timestamp)
+    monkeypatch.setattr(data_fetcher, "_fetch_stock_data_coalesced", fake_fetch)
+    monkeypatch.setattr(data_fetcher, "_redis_client", redis)
+    results = asyncio.run(data_fetcher.fetch_stock_data_batch(["HIT", "MISS"]))
+
+    assert len(redis.mgets) == 1 and len(redis.mgets[0]) == 2
+    assert results["HIT"]["info"] == {"symbol": "HIT"}
+    assert fetched == ["MISS"]
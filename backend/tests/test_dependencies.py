@@ -0,0 +1,73 @@
+import asyncio
+from dataclasses import fields
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.auth.jwt import create_access_token
+from app import dependencies
+from app.dependencies import AuthenticatedUser, _resolve_user, invalidate_cached_user
+
+
+class _FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def one_or_none(self):
+        return self._row
+
+
+class _FakeSession:
+    """Stands in for the request's AsyncSession, counting the queries it receives."""
+
+    def __init__(self, user):
+        self.user = user
+        self.queries = 0
+
+    async def execute(self, statement):
+        self.queries += 1
+        self.statement = statement
+        if self.user is None:
+            return _FakeResult(None)
+        return _FakeResult(tuple(getattr(self.user, column.name) for column in statement.selected_columns))
+
+
+def _db_user(**overrides):
+    now = datetime.now(timezone.utc)
+    columns = dict(id=uuid4(), email="user@example.com", name="User", is_active=True,
+                   is_guest=False, created_at=now, updated_at=now)
+    columns.update(overrides)
+    return SimpleNamespace(**columns)
+
+# --- Tests for _resolve_user ---
+def test_resolve_user_caches_a_detached_snapshot():
+    """
+    Tests that the authenticated user is loaded as columns and cached as a snapshot, not an ORM instance.
+    """
+    db_user = _db_user()
+    token = create_access_token({"sub": str(db_user.id), "email": db_user.email})
+    session = _FakeSession(db_user)
+    try:
+        user, error = asyncio.run(_resolve_user(token, session))
+        assert error is None
+        assert isinstance(user, AuthenticatedUser) and user is not db_user
+        assert (user.id, user.email, user.is_active) == (db_user.id, db_user.email, True)
+        assert all(column.table.name == "users" for column in session.statement.selected_columns)
+        assert len(session.statement.column_descriptions) == len(fields(AuthenticatedUser))
+
+        # Later changes to the source row (e.g. a rollback expiring it) must not reach the cached user
+        db_user.is_active = None
+        cached, _ = asyncio.run(_resolve_user(token, _FakeSession(None)))
+        assert cached == user and cached.is_active is True
+        assert session.queries == 1
+    finally:
+        invalidate_cached_user(db_user.id)
+
+def test_resolve_user_reports_unknown_users():
+    """
+    Tests that a valid token for a user that no longer exists is rejected and nothing is cached.
+    """
+    user_id = uuid4()
+    token = create_access_token({"sub": str(user_id)})
+    assert asyncio.run(_resolve_user(token, _FakeSession(None))) == (None, "User not found")
+    assert user_id not in dependencies._user_cache
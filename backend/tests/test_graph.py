@@ -0,0 +1,44 @@
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from app.financial_agent.graph import _select_tool_schemas, _tool_schema_entries
+
+
+def _schema(name):
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": "x" * 500,
+            "parameters": {"type": "object", "properties": {"ticker": {"type": "string", "description": "Ticker"}}},
+        },
+    }
+
+ENTRIES = _tool_schema_entries([_schema("search"), _schema("price")])
+
+def _is_full(schema):
+    return len(schema["function"]["description"]) == 500
+
+# --- Tests for _select_tool_schemas ---
+def test_select_tool_schemas_sends_full_schemas_for_a_new_turn():
+    """
+    Tests that every tool keeps its full schema when the user has just spoken.
+    """
+    schemas = _select_tool_schemas([HumanMessage("search for the price")], ENTRIES)
+    assert all(_is_full(schema) for schema in schemas)
+
+def test_select_tool_schemas_keeps_only_tools_called_this_turn():
+    """
+    Tests that only tools called since the last user message keep their full schema, whatever the user wrote.
+    """
+    messages = [
+        HumanMessage("search the news"),
+        AIMessage("", tool_calls=[{"name": "search", "args": {}, "id": "1"}]),
+        ToolMessage("{}", tool_call_id="1"),
+        AIMessage("Done."),
+        HumanMessage("what is the search price"),
+        AIMessage("", tool_calls=[{"name": "price", "args": {"ticker": "AAPL"}, "id": "2"}]),
+        ToolMessage("{}", tool_call_id="2"),
+    ]
+    search, price = _select_tool_schemas(messages, ENTRIES)
+    assert not _is_full(search)
+    assert _is_full(price)
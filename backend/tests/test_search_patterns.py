@@ -0,0 +1,45 @@
+from app.financial_agent.config.search_patterns import FinancialDataPatterns
+
+CONTENT = (
+    "Annual report highlights: ROIC: 15.2% and Return on Equity: 21%. "
+    "Total Debt: $1,234.5M against Shareholder Equity: 9,876 with Net Income: 512.3M. "
+    "Analysts expect P/E Ratio 24.5 next year. Überblick: ROE: 19%"
+)
+
+# --- Tests for FinancialDataPatterns ---
+def test_extract_all_metrics_matches_extract_metric():
+    """
+    Tests that extracting every metric in one call agrees with extracting each metric on its own.
+    """
+    patterns = FinancialDataPatterns()
+    all_metrics = patterns.extract_all_metrics(CONTENT)
+    for metric_type in FinancialDataPatterns.PATTERNS:
+        assert sorted(all_metrics.get(metric_type, [])) == sorted(patterns.extract_metric(CONTENT, metric_type))
+    assert all_metrics["total_stockholder_equity"]
+    assert "ebitda" not in all_metrics
+
+def test_extract_metric_keeps_best_confidence_per_value():
+    """
+    Tests that a value captured by several overlapping patterns is returned once, with its best confidence.
+    """
+    matches = FinancialDataPatterns().extract_metric(CONTENT, "roic")
+    assert [raw for _, raw, _ in matches] == ["15.2"]
+    assert matches[0][2] == 80
+
+def test_literal_prefix_keeps_optional_characters_optional():
+    """
+    Tests that a quantified last character is left out of a pattern's literal prefix.
+    """
+    prefixes = [prefix for _, _, prefix in FinancialDataPatterns.COMPILED_PATTERNS["total_stockholder_equity"]]
+    assert "shareholder" in prefixes and "shareholders" not in prefixes
+    matches = FinancialDataPatterns().extract_metric(CONTENT.encode("ascii", "ignore").decode(), "total_stockholder_equity")
+    assert 9876.0 in [value for value, _, _ in matches]
+
+def test_prefilter_handles_case_fold_exceptions():
+    """
+    Tests that content whose case folding differs from lower() still matches like re.IGNORECASE.
+    """
+    patterns = FinancialDataPatterns()
+    assert patterns._lowercase_for_prefilter("Revenue \u2014 \u201cSales Growth\u201d") is not None
+    assert patterns._lowercase_for_prefilter("\u017fales Growth: 12%") is None
+    assert [value for value, _, _ in patterns.extract_metric("\u017fales Growth: 12%", "sales_growth")] == [12.0]